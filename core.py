@@ -2,6 +2,7 @@ import re
 import json
 import os
 import time
+import queue
 import threading
 import requests
 import pygame
@@ -11,7 +12,8 @@ import struct
 import webbrowser
 from datetime import datetime, timedelta, timezone
 from urllib.parse import urlencode
-from PyQt6.QtCore import pyqtSignal, QThread
+from PyQt6.QtCore import pyqtSignal, QThread, QObject, QRunnable
+from PyQt6.QtGui import QColor, QPixmap, QPixmapCache
 
 
 
@@ -57,9 +59,45 @@ def _config_file() -> str:
 def _default_sound() -> str:
     return os.path.join(_config_dir, 'notification.wav') if _config_dir else ''
 
-# global cover image cache: beatmapset id -> qpixmap
+# global cover image cache: beatmapset id -> qpixmap, kept in qpixmapcache (byte bounded, lru)
 
-_cover_cache: dict = {}
+# ids whose cover failed to load are only remembered in a small set
+
+_cover_missing: set = set()
+
+_cover_placeholder_pix = None
+
+
+def _cover_cache_find(bid):
+    # return the cached cover qpixmap for bid, or none if not cached
+
+    return QPixmapCache.find(f'cover:{bid}')
+
+
+def _cover_cache_store(bid, data):
+    # decode downloaded cover bytes and cache them. returns the qpixmap or none for missing covers
+
+    # main thread only (qpixmap)
+
+    if not data:
+        _cover_missing.add(bid)
+        return None
+    pix = QPixmap()
+    if not pix.loadFromData(data):
+        _cover_missing.add(bid)
+        return None
+    QPixmapCache.insert(f'cover:{bid}', pix)
+    return pix
+
+
+def _cover_placeholder():
+    # one shared placeholder pixmap for rows without a cover
+
+    global _cover_placeholder_pix
+    if _cover_placeholder_pix is None:
+        _cover_placeholder_pix = QPixmap(88, 54)
+        _cover_placeholder_pix.fill(QColor(COLOR_BG))
+    return _cover_placeholder_pix
 
 # miku color scheme, modern
 
@@ -112,21 +150,27 @@ _oauth_token_expiry: float = 0.0
 
 # browse card stylesheets as module constants (computed once at startup)
 
-_BROWSE_STYLE_BASE = f"""
-    QFrame {{ background: {COLOR_CARD}; border: 2px solid transparent; border-radius: 10px; }}
-    QLabel {{ background: transparent; border: none; color: {COLOR_TEXT}; }}
-"""
-_BROWSE_STYLE_HOVER = f"""
-    QFrame {{ background: {COLOR_BG_LIGHT}; border: 2px solid {COLOR_ACCENT}60; border-radius: 10px; }}
-    QLabel {{ background: transparent; border: none; color: {COLOR_TEXT}; }}
-"""
-_BROWSE_STYLE_SELECTED = f"""
-    QFrame {{ background: {COLOR_ACCENT}15; border: 2px solid {COLOR_ACCENT}; border-radius: 10px; }}
-    QLabel {{ background: transparent; border: none; color: {COLOR_TEXT}; }}
+# set once on the browse cards container, cards switch look through their "state" property
+
+_BROWSE_CARDS_STYLE = f"""
+    QWidget#browseCards {{ background: transparent; }}
+    QFrame#browseCard {{ background: {COLOR_CARD}; border: 2px solid transparent; border-radius: 10px; }}
+    QFrame#browseCard[state="hover"] {{ background: {COLOR_BG_LIGHT}; border: 2px solid {COLOR_ACCENT}60; }}
+    QFrame#browseCard[state="selected"] {{ background: {COLOR_ACCENT}15; border: 2px solid {COLOR_ACCENT}; }}
+    QFrame#browseCard[state="done"] {{ background: {COLOR_BG_LIGHT}; border: 2px solid {COLOR_ACCENT}40; }}
+    QFrame#browseCard QLabel {{ background: transparent; border: none; color: {COLOR_TEXT}; }}
+    QFrame#browseCard[state="done"] QLabel {{ color: {COLOR_TEXT_DIM}; }}
 """
-_BROWSE_STYLE_DONE = f"""
-    QFrame {{ background: {COLOR_BG_LIGHT}; border: 2px solid {COLOR_ACCENT}40; border-radius: 10px; }}
-    QLabel {{ background: transparent; border: none; color: {COLOR_TEXT_DIM}; }}
+
+# tracked cards work the same way, monitored cards get a green outline
+
+_TRACKED_CARDS_STYLE = f"""
+    QWidget#trackedCards {{ background: transparent; }}
+    QFrame#beatmapCard {{ background: {COLOR_CARD}; border: 2px solid transparent; border-radius: 10px; }}
+    QFrame#beatmapCard[state="monitored"] {{ border: 2px solid {COLOR_SUCCESS}60; }}
+    QFrame#beatmapCard[state="hover"] {{ background: {COLOR_BG_LIGHT}; border: 2px solid {COLOR_ACCENT}60; }}
+    QFrame#beatmapCard[state="selected"] {{ background: {COLOR_ACCENT}15; border: 2px solid {COLOR_ACCENT}; }}
+    QFrame#beatmapCard QLabel {{ background: transparent; border: none; color: {COLOR_TEXT}; }}
 """
 
 BEATMAP_STATUS = {
@@ -144,6 +188,11 @@ BEATMAP_STATUS = {
 
 }
 
+# status lookup by either the api's int id or the string key, so hot paths
+# don't str() every status_id before the dict lookup
+
+_STATUS_BY_ANY = {**BEATMAP_STATUS, **{int(k): v for k, v in BEATMAP_STATUS.items()}}
+
 class _CoverLoaderThread(QThread):
     # downloads one cover image and emits result on the main thread via qt signal
 
@@ -209,56 +258,128 @@ _cover_pool = _CoverPool()
 _cover_pool = _CoverPool()
 
 class MonitorWorkerThread(QThread):
-    # runs all api checks in background. emits results, never touches ui
+    # long lived api checker, started once and fed through submit(). emits one result
+    # list per submitted check, never touches ui
 
     result_ready = pyqtSignal(list)
 
-    def __init__(self, beatmaps, client_id, client_secret):
+    def __init__(self):
         super().__init__()
-        self.beatmaps = beatmaps
-        self.client_id = client_id
-        self.client_secret = client_secret
+        self._requests = queue.Queue(maxsize=1)
+        self._stopping = False
+
+    def submit(self, targets, client_id, client_secret, cache_ttl=0):
+        # queue a check of (index, beatmapset id, status id, last checked, difficulty id)
+        # tuples. beatmaps checked within cache_ttl seconds are skipped. False if a
+        # check is still queued
+
+        try:
+            self._requests.put_nowait((targets, client_id, client_secret, cache_ttl))
+            return True
+        except queue.Full:
+            return False
+
+    def stop(self):
+        # drop a queued check and end the loop once the current request returns
+
+        self._stopping = True
+        try:
+            self._requests.get_nowait()
+        except queue.Empty:
+            pass
+        self._requests.put_nowait(None)
 
     def run(self):
+        while True:
+            request = self._requests.get()
+            if request is None or self._stopping:
+                return
+            results = self._check(*request)
+            if not self._stopping:
+                self.result_ready.emit(results)
+
+    def _check(self, targets, client_id, client_secret, cache_ttl):
+        # status changes are diffed here and carry a ready history entry, the ui
+        # thread only applies them
+
         results = []
-        for i, beatmap in enumerate(self.beatmaps):
-            if not beatmap.get('monitored', False):
-                results.append({'index': i, 'ok': False, 'skipped': True})
-                continue
-            info = get_beatmap_info(self.client_id, self.client_secret, beatmap['id'])
-            results.append({'index': i, 'beatmap': beatmap, 'info': info,
-                            'old_status': beatmap['status_id']})
-        self.result_ready.emit(results)
+        default_status = BEATMAP_STATUS['0']
+        fresh_since = time.time() - cache_ttl if cache_ttl > 0 else None
+        if fresh_since is not None:
+            targets = [t for t in targets if t[3] <= fresh_since]
+
+        # sets with a known difficulty id get their status 50 at a time
+
+        batched = {}
+        diff_ids = [t[4] for t in targets if t[4]]
+        for start in range(0, len(diff_ids), _STATUS_BATCH_SIZE):
+            if self._stopping:
+                break
+            batched.update(get_beatmapset_statuses(
+                client_id, client_secret, diff_ids[start:start + _STATUS_BATCH_SIZE]))
+
+        for i, bid, old_status, last_checked, diff_id in targets:
+            if self._stopping:
+                break
+            info = batched.get(diff_id)
+            if info is not None and info['beatmapset_id'] != bid:
+                info = None
+            # sets the batch didn't cover, and ones whose status changed, get the full
+            # lookup, which also has the diffs and rank date for the card and history
+
+            if info is None or info['status_id'] != old_status:
+                full = get_beatmap_info(client_id, client_secret, bid)
+                if full['ok'] or info is None:
+                    info = full
+            result = {'index': i, 'id': bid, 'info': info}
+            if info['ok'] and info['status_id'] != old_status:
+                result['history'] = {
+                    'timestamp': time.time(),
+                    'beatmap_id': bid,
+                    'title': f"{info['artist']} - {info['title']}",
+                    'creator': info['creator'],
+                    'old_status': _STATUS_BY_ANY.get(old_status, default_status)['name'],
+                    'new_status': _STATUS_BY_ANY.get(info['status_id'], default_status)['name'],
+                    'approved_date': info.get('approved_date', None),
+                    'mode': info.get('mode', '0')
+                }
+            results.append(result)
+        return results
 
 
 class RefreshAllWorkerThread(QThread):
-    # refreshes all beatmap statuses in background
+    # refreshes all beatmap statuses in background. takes (index, beatmapset id) pairs
 
     result_ready = pyqtSignal(list)
 
-    def __init__(self, beatmaps, client_id, client_secret):
+    def __init__(self, targets, client_id, client_secret):
         super().__init__()
-        self.beatmaps = beatmaps
+        self.targets = targets
         self.client_id = client_id
         self.client_secret = client_secret
 
     def run(self):
         results = []
-        for i, beatmap in enumerate(self.beatmaps):
-            info = get_beatmap_info(self.client_id, self.client_secret, beatmap['id'])
-            results.append({'index': i, 'info': info})
+        for i, bid in self.targets:
+            info = get_beatmap_info(self.client_id, self.client_secret, bid)
+            results.append({'index': i, 'id': bid, 'info': info})
         self.result_ready.emit(results)
 
 
-class BrowseQualifiedWorkerThread(QThread):
-    # fetches beatmaps from osu! api v2 search with configurable status
+class WorkerSignals(QObject):
+    # signal carrier for pooled workers, a QRunnable cannot emit signals itself
 
-    result_ready = pyqtSignal(list)
+    result_ready = pyqtSignal(object)
     error_occurred = pyqtSignal(str)
 
-    def __init__(self, client_id, client_secret, mode=None, cursor_string=None,
+
+class BrowseQualifiedWorker(QRunnable):
+    # fetches beatmaps from osu! api v2 search with configurable status, run on a QThreadPool
+
+    def __init__(self, signals, client_id, client_secret, mode=None, cursor_string=None,
                  status='qualified', query='', sort=''):
         super().__init__()
+        self.signals = signals
         self.client_id = client_id
         self.client_secret = client_secret
         self.mode = mode
@@ -270,7 +391,7 @@ class BrowseQualifiedWorkerThread(QThread):
     def run(self):
         token = get_oauth_token(self.client_id, self.client_secret)
         if not token:
-            self.error_occurred.emit('Auth failed. Check Client ID / Secret.')
+            self.signals.error_occurred.emit('Auth failed. Check Client ID / Secret.')
             return
         try:
             parts = {'nsfw': 'true'}
@@ -326,6 +447,7 @@ class BrowseQualifiedWorkerThread(QThread):
                     'title': bm.get('title', ''),
                     'creator': bm.get('creator', ''),
                     'status_id': status_id,
+                    'diff_id': str(beatmaps_sorted[0]['id']) if beatmaps_sorted else None,
                     'mode': primary_mode,
                     'modes': modes,
                     'diffs': diffs,
@@ -334,9 +456,9 @@ class BrowseQualifiedWorkerThread(QThread):
                     'total_spinners': total_spinners,
                     'cursor_string': data.get('cursor_string'),
                 })
-            self.result_ready.emit(results)
+            self.signals.result_ready.emit(results)
         except Exception as e:
-            self.error_occurred.emit(f'Network error: {e}')
+            self.signals.error_occurred.emit(f'Network error: {e}')
 
 def create_default_sound():
     path = _default_sound()
@@ -369,6 +491,12 @@ def load_config():
         'utc_offset': 0,
         'auto_utc': True,
         'auto_stop_monitoring': False,
+        # skip monitor requests for beatmaps checked within this many seconds, 0 = off
+
+        'api_cache_ttl': 0,
+        # stretch the check interval up to 5x after quiet checks, back to base on a change
+
+        'adaptive_interval': False,
     }
     path = _config_file()
     if path and os.path.exists(path):
@@ -385,14 +513,50 @@ def load_config():
     return cfg
 
 
-def save_config(cfg):
+# config writes come from the ui thread and from the main window's save pool. the
+# lock keeps two writes from interleaving, the sequence number keeps an older
+# snapshot from landing after a newer one
+
+_config_lock = threading.Lock()
+_config_seq = 0
+_config_written = 0
+
+
+def dump_config(cfg):
+    # serialise cfg now, on the thread that owns it. returns (seq, text) for write_config
+
+    global _config_seq
+    # default=list writes the history deque as a plain json array
+
+    text = json.dumps(cfg, indent=4, ensure_ascii=False, default=list)
+    with _config_lock:
+        _config_seq += 1
+        return _config_seq, text
+
+
+def write_config(seq, text):
+    # write a dump_config snapshot, safe to call from any thread
+
+    global _config_written
     path = _config_file()
     if not path:
         return False
-    try:
-        with open(path, 'w', encoding='utf-8') as f:
-            json.dump(cfg, f, indent=4, ensure_ascii=False)
+    with _config_lock:
+        if seq < _config_written:
+            return True  # a newer snapshot is already on disk
+
+        try:
+            with open(path, 'w', encoding='utf-8') as f:
+                f.write(text)
+        except Exception:
+            return False
+        _config_written = seq
         return True
+
+
+def save_config(cfg):
+    try:
+        return write_config(*dump_config(cfg))
     except Exception:
         return False
 
@@ -471,6 +635,7 @@ def get_beatmap_info(client_id, client_secret, beatmapset_id):
             'creator': data.get('creator', ''),
             'status_id': status_id,
             'beatmapset_id': str(data.get('id', beatmapset_id)),
+            'diff_id': str(beatmaps_sorted[0]['id']) if beatmaps_sorted else None,
             'approved_date': ranked_date,
             'mode': primary_mode,
             'modes': modes,
@@ -481,6 +646,47 @@ def get_beatmap_info(client_id, client_secret, beatmapset_id):
         return {'ok': False, 'error': f'Network Error: {str(e)}'}
 
 
+# GET /beatmaps takes at most this many ids per request
+
+_STATUS_BATCH_SIZE = 50
+
+
+def get_beatmapset_statuses(client_id, client_secret, diff_ids):
+    # status of up to _STATUS_BATCH_SIZE beatmapsets in one request, each looked up
+    # through one of its difficulty ids. returns {difficulty id: info} with the status
+    # fields of get_beatmap_info. ids the api left out, or a failed request, give no entry
+
+    if not client_id or not client_secret:
+        return {}
+    token = get_oauth_token(client_id, client_secret)
+    if not token:
+        return {}
+    try:
+        r = requests.get(
+            'https://osu.ppy.sh/api/v2/beatmaps',
+            params=[('ids[]', d) for d in diff_ids],
+            headers={'Authorization': f'Bearer {token}',
+                     'Accept': 'application/json'},
+            timeout=5
+        )
+        if r.status_code != 200:
+            return {}
+        found = {}
+        for b in r.json().get('beatmaps', []):
+            beatmapset = b.get('beatmapset') or {}
+            found[str(b['id'])] = {
+                'ok': True,
+                'artist': beatmapset.get('artist', ''),
+                'title': beatmapset.get('title', ''),
+                'creator': beatmapset.get('creator', ''),
+                'status_id': V2_STATUS_MAP.get(beatmapset.get('status') or b.get('status', 'pending'), '0'),
+                'beatmapset_id': str(b.get('beatmapset_id', beatmapset.get('id', ''))),
+            }
+        return found
+    except Exception:
+        return {}
+
+
 def get_beatmap_cover_bytes(beatmapset_id, cover_type='card'):
     # download beatmap cover image and return raw bytes (thread safe).
 
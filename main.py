@@ -1,7 +1,7 @@
 import sys
 import os
 from PyQt6.QtWidgets import QApplication
-from PyQt6.QtGui import QFont, QIcon
+from PyQt6.QtGui import QFont, QIcon, QPixmapCache
 import base64
 import tempfile
 
@@ -20,12 +20,19 @@ def main():
     app.setOrganizationName('MikuEye')
     app.setApplicationDisplayName('MikuEye')
 
-    try:
-        import ctypes
-        myappid = 'mikueye.beatmaptracker.1.0'
-        ctypes.windll.shell32.SetCurrentProcessExplicitAppUserModelID(myappid)
-    except Exception:
-        pass
+    # room for full size covers plus their scaled variants (kb)
+
+    QPixmapCache.setCacheLimit(65536)
+
+    # taskbar grouping id, windows only
+
+    if sys.platform == 'win32':
+        try:
+            import ctypes
+            myappid = 'mikueye.beatmaptracker.1.0'
+            ctypes.windll.shell32.SetCurrentProcessExplicitAppUserModelID(myappid)
+        except Exception:
+            pass
 
     icon_path = _extract_icon()
     if icon_path:
@@ -2,9 +2,14 @@ import sys
 import os
 import json
 import re
+import html
 import pygame
 import webbrowser
 import time
+from collections import OrderedDict, deque
+from contextlib import contextmanager
+from functools import lru_cache
+from itertools import chain, zip_longest
 from datetime import datetime, timedelta, timezone
 from PyQt6.QtWidgets import (QApplication, QMainWindow, QWidget, QVBoxLayout,
                              QHBoxLayout, QLabel, QPushButton, QLineEdit,
@@ -13,23 +18,32 @@ from PyQt6.QtWidgets import (QApplication, QMainWindow, QWidget, QVBoxLayout,
                              QScrollArea, QSizePolicy, QMenu,
                              QDoubleSpinBox, QGridLayout, QStackedWidget,
                              QSpinBox)
-from PyQt6.QtCore import Qt, QTimer, pyqtSignal, QThread, QPoint
-from PyQt6.QtGui import QFont, QIcon, QPixmap, QShortcut, QKeySequence
+from PyQt6.QtCore import Qt, QTimer, pyqtSignal, QThread, QPoint, QRectF, QRunnable, QThreadPool
+from PyQt6.QtGui import (QFont, QIcon, QPixmap, QShortcut, QKeySequence, QPainter,
+                         QColor, QFontMetrics, QPixmapCache)
 
 from core import (
     _config_file, _default_sound,
     DEFAULT_CHECK_INTERVAL, _save_config_dir,
     COLOR_BG, COLOR_BG_LIGHT, COLOR_CARD, COLOR_ACCENT, COLOR_ACCENT_DARK,
     COLOR_TEXT, COLOR_TEXT_DIM, COLOR_SUCCESS, COLOR_WARNING, COLOR_DANGER,
-    V2_STATUS_MAP, MODE_INFO, BEATMAP_STATUS,
-    _BROWSE_STYLE_BASE, _BROWSE_STYLE_HOVER, _BROWSE_STYLE_SELECTED, _BROWSE_STYLE_DONE,
-    _cover_pool, _cover_cache,
-    MonitorWorkerThread, RefreshAllWorkerThread, BrowseQualifiedWorkerThread,
-    load_config, save_config, get_oauth_token, get_beatmap_info, get_beatmap_cover_bytes,
+    V2_STATUS_MAP, MODE_INFO, BEATMAP_STATUS, _STATUS_BY_ANY,
+    _BROWSE_CARDS_STYLE, _TRACKED_CARDS_STYLE,
+    _cover_pool, _cover_missing, _cover_cache_find, _cover_cache_store, _cover_placeholder,
+    MonitorWorkerThread, RefreshAllWorkerThread, BrowseQualifiedWorker, WorkerSignals,
+    load_config, save_config, dump_config, write_config, get_oauth_token, get_beatmap_info, get_beatmap_cover_bytes,
     create_default_sound,
 )
 import core as _core
 
+# osu! api iso 8601 dates and the older space separated format, parsed without strptime
+
+_ISO_RE = re.compile(r'^(\d{4})-(\d{2})-(\d{2})[T ](\d{2}):(\d{2}):(\d{2})(?:Z|\+00:00)?$')
+
+# beatmapset id inside a pasted osu! url
+
+_BMS_ID_RE = re.compile(r'/beatmapsets?/(\d+)')
+
 class HoverTooltip(QWidget):
     # styled floating tooltip shown on button hover
 
@@ -135,16 +149,37 @@ def _lineedit_context_menu(widget: QLineEdit, pos, menu_style: str):
         widget.selectAll()
 
 
+@lru_cache(maxsize=256)
+def _tag_pixmap(text: str, bg: str, font_px: int = 10) -> QPixmap:
+    # pill shaped tag rendered once per (text, colour, size) and shared by every card
+
+    font = QFont()
+    font.setPixelSize(font_px)
+    font.setBold(True)
+    w = QFontMetrics(font).horizontalAdvance(text) + 12
+    h = 18
+    dpr = QApplication.instance().devicePixelRatio()
+    pix = QPixmap(round(w * dpr), round(h * dpr))
+    pix.setDevicePixelRatio(dpr)
+    pix.fill(Qt.GlobalColor.transparent)
+    painter = QPainter(pix)
+    painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+    painter.setPen(Qt.PenStyle.NoPen)
+    painter.setBrush(QColor(bg))
+    painter.drawRoundedRect(QRectF(0, 0, w, h), 4, 4)
+    painter.setPen(QColor('#000'))
+    painter.setFont(font)
+    painter.drawText(QRectF(0, 0, w, h), Qt.AlignmentFlag.AlignCenter, text)
+    painter.end()
+    return pix
+
+
 def _tag_label(text: str, bg: str) -> QLabel:
     # pill shaped coloured tag label used on beatmap cards
 
-    label = QLabel(text)
-    label.setStyleSheet(
-        f"color: #000; background: {bg}; border radius: 4px;"
-
-        f" padding: 0px 6px; font-size: 10px; font-weight: bold; border: none;")
+    label = QLabel()
+    label.setPixmap(_tag_pixmap(text, bg))
     label.setFixedHeight(18)
-    label.setAlignment(Qt.AlignmentFlag.AlignCenter)
     return label
 
 
@@ -152,7 +187,7 @@ def _stat_label(text: str, tip: str = '') -> QLabel:
     # dimmed stat label used on beatmap cards
 
     label = QLabel(text)
-    label.setStyleSheet(f"color: {COLOR_TEXT_DIM}; font-size: 11px; background: transparent; border: none;")
+    label.setStyleSheet(_DIM_TEXT_CSS)
     if tip:
         label.setToolTip(tip)
     return label
@@ -176,6 +211,100 @@ def _star_color(stars: float) -> str:
     return '#dd44dd'
 
 
+# card label stylesheets, built once instead of per label
+
+_DIM_TEXT_CSS = f"color: {COLOR_TEXT_DIM}; font-size: 11px; background: transparent; border: none;"
+
+# tracked card cover label: loaded, still downloading, no cover
+
+_COVER_CSS = f"background: {COLOR_BG}; border-radius: 6px; border: none;"
+_COVER_LOADING_CSS = f"background: {COLOR_BG}; border-radius: 6px; color: {COLOR_TEXT_DIM}; font-size: 14px; border: none;"
+_COVER_MISSING_CSS = f"background: {COLOR_CARD}; border-radius: 6px; color: {COLOR_TEXT_DIM}; font-size: 9px;"
+
+# detail panel status label, one [state="<status name>"] color rule per status so
+# switching beatmaps only repolishes the label
+
+_DETAIL_STATUS_STYLE = f"""
+    QLabel {{
+        color: {COLOR_ACCENT};
+        font-size: 48px;
+        font-weight: bold;
+        padding: 20px;
+    }}
+""" + "".join(
+    f'QLabel[state="{info["name"]}"] {{ color: {info["color"]}; }}\n'
+    for info in BEATMAP_STATUS.values()
+)
+
+# detail panel id label and its [state="copied"] flash after a click
+
+_DETAIL_ID_STYLE = f"""
+    QLabel {{
+        color: {COLOR_TEXT_DIM};
+        font-size: 12px;
+        font-family: 'Consolas', monospace;
+        padding: 8px;
+        background-color: {COLOR_BG};
+        border-radius: 6px;
+        border: 2px solid transparent;
+    }}
+    QLabel[state="copied"] {{
+        color: {COLOR_ACCENT};
+        background-color: {COLOR_ACCENT}20;
+        border-color: {COLOR_ACCENT};
+    }}
+"""
+_TITLE_CSS = f"color: {COLOR_TEXT}; font-size: 12px; font-weight: bold; background: transparent; border: none;"
+_TITLE_CSS_DIM = f"color: {COLOR_TEXT_DIM}; font-size: 12px; font-weight: bold; background: transparent; border: none;"
+_ACCENT_TAG_CSS = f"color: {COLOR_ACCENT}; font-size: 10px; font-weight: bold; background: transparent; border: none;"
+_CARD_ID_CSS = f"color: {COLOR_TEXT_DIM}50; font-size: 10px; font-family: Consolas; background: transparent; border: none;"
+_BROWSE_COVER_CSS = f"background: {COLOR_BG}; border-radius: 6px; border: none;"
+_CARD_SEP_CSS = f"background: {COLOR_ACCENT}30; border: none;"
+
+
+def _set_card_state(card: QWidget, state: str):
+    # switch a card between [state="..."] selectors of its parent stylesheet,
+    # repolishing only that card instead of reparsing a stylesheet
+
+    if card.property('state') == state:
+        return
+    card.setProperty('state', state)
+    style = card.style()
+    style.unpolish(card)
+    style.polish(card)
+
+
+_DIFFS_CSS = f"color: {COLOR_TEXT_DIM}; font-size: 11px; background: transparent; border: none;"
+
+
+def _diffs_html(diffs) -> str:
+    # every difficulty row of a card as one rich text table: stars, name, length, spinners
+
+    # cell padding keeps the 19px row pitch of the old one label per column rows
+
+    rows = []
+    for i, diff in enumerate(diffs):
+        stars = diff.get('stars', 0)
+        mins, secs = divmod(diff.get('length', 0), 60)
+        spinners = f"&nbsp;&nbsp;◎ {diff['spinners']}" if diff.get('spinners') else ''
+        pad = f"padding-top: {2 if i == 0 else 4}px; padding-bottom: 2px;"
+        rows.append(
+            f'<tr><td width="60" style="{pad} color: {_star_color(stars)}; font-weight: bold;">★ {stars:.2f}</td>'
+            f'<td style="{pad} white-space: nowrap;">{html.escape(diff.get("name", ""))}</td>'
+            f'<td align="right" style="{pad} white-space: nowrap;">⏱ {mins}:{secs:02d}{spinners}</td></tr>')
+    return '<table width="100%" cellspacing="0" cellpadding="0">' + ''.join(rows) + '</table>'
+
+
+def _diffs_label(diffs) -> QLabel:
+    # all difficulty rows of a card in one rich text label
+
+    label = QLabel(_diffs_html(diffs))
+    label.setTextFormat(Qt.TextFormat.RichText)
+    label.setStyleSheet(_DIFFS_CSS)
+    label.setAlignment(Qt.AlignmentFlag.AlignTop | Qt.AlignmentFlag.AlignLeft)
+    return label
+
+
 
 def _scale_cover(pixmap: QPixmap, w: int, h: int) -> QPixmap:
     # scale and centre crop a cover pixmap to exactly w×h
@@ -190,6 +319,33 @@ def _scale_cover(pixmap: QPixmap, w: int, h: int) -> QPixmap:
     return scaled
 
 
+def _scaled_cover(bid, pixmap: QPixmap, w: int, h: int) -> QPixmap:
+    # cover for bid cropped to w×h, scaled once per size and kept in qpixmapcache
+
+    key = f'cover:{bid}:{w}x{h}'
+    scaled = QPixmapCache.find(key)
+    if scaled is None:
+        scaled = _scale_cover(pixmap, w, h)
+        QPixmapCache.insert(key, scaled)
+    return scaled
+
+
+@contextmanager
+def _batch_updates(widget: QWidget, *quiet):
+    # suspend repaints on widget (and signals on quiet objects) while many
+    # children are added, moved or removed, then repaint once at the end
+
+    widget.setUpdatesEnabled(False)
+    blocked = [obj.blockSignals(True) for obj in quiet]
+    try:
+        yield widget
+    finally:
+        for obj, was_blocked in zip(quiet, blocked):
+            obj.blockSignals(was_blocked)
+        widget.setUpdatesEnabled(True)
+        widget.update()
+
+
 def _scrollbar_style():
     return f"""
         QScrollBar:vertical {{
@@ -284,46 +440,19 @@ class BeatmapCard(QFrame):
         self.main_window = main_window
         self._loader = None
         self._is_selected = False
+        self._cover_bid = None
         self._setup_ui()
 
     def _setup_ui(self):
-        bm = self.beatmap
-        bid = bm['id']
-        status_info = BEATMAP_STATUS.get(str(bm.get('status_id', '0')), BEATMAP_STATUS['0'])
-        mode_info = MODE_INFO.get(bm.get('mode'), MODE_INFO[None])
-        diffs = bm.get('diffs', [])
-        diff_count = bm.get('diff_count', len(diffs))
-        max_length = bm.get('max_length', 0)
-        total_sp = bm.get('total_spinners', 0)
-        monitored = bm.get('monitored', False)
+        # widgets are built once per card, _fill() points them at self.beatmap so
+        # a pooled card can be reused for another beatmap
 
-        DIFF_ROW_H = 19
-        diff_section_h = (5 + len(diffs) * DIFF_ROW_H) if diffs else 0
-        card_height = 78 + diff_section_h
-
-        self.setFixedHeight(card_height)
         self.setCursor(Qt.CursorShape.PointingHandCursor)
 
-        # styles, same as browse cards
+        # styled by _TRACKED_CARDS_STYLE on the list container, same as browse cards
 
-        self._base_style = f"""
-            QFrame {{ background: {COLOR_CARD}; border: 2px solid transparent; border-radius: 10px; }}
-            QLabel {{ background: transparent; border: none; color: {COLOR_TEXT}; }}
-        """
-        self._sel_style = f"""
-            QFrame {{ background: {COLOR_ACCENT}15; border: 2px solid {COLOR_ACCENT}; border-radius: 10px; }}
-            QLabel {{ background: transparent; border: none; color: {COLOR_TEXT}; }}
-        """
-        self._mon_style = f"""
-            QFrame {{ background: {COLOR_CARD}; border: 2px solid {COLOR_SUCCESS}60; border-radius: 10px; }}
-            QLabel {{ background: transparent; border: none; color: {COLOR_TEXT}; }}
-        """
-        self._mon_sel_style = f"""
-            QFrame {{ background: {COLOR_ACCENT}15; border: 2px solid {COLOR_ACCENT}; border-radius: 10px; }}
-            QLabel {{ background: transparent; border: none; color: {COLOR_TEXT}; }}
-        """
-        _mon = self.beatmap.get("monitored", False)
-        self.setStyleSheet(self._mon_style if _mon else self._base_style)
+        self.setObjectName("beatmapCard")
+        self.setProperty('state', 'monitored' if self.beatmap.get('monitored', False) else 'base')
 
         root_layout = QVBoxLayout(self)
         root_layout.setContentsMargins(8, 8, 10, 8)
@@ -339,25 +468,8 @@ class BeatmapCard(QFrame):
 
         self.cover_label = QLabel()
         self.cover_label.setFixedSize(96, 62)
-        self.cover_label.setStyleSheet(f"background: {COLOR_BG}; border-radius: 6px; border: none;")
+        self.cover_label.setStyleSheet(_COVER_CSS)
         self.cover_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        if bid in _cover_cache:
-            self._apply_cover(_cover_cache[bid])
-        else:
-            self.cover_label.setText("...")
-            self.cover_label.setStyleSheet(
-                f"background: {COLOR_BG}; border-radius: 6px; color: {COLOR_TEXT_DIM}; font-size: 14px; border: none;")
-            def _cb(b, data, card=self):
-                try:
-                    px = QPixmap()
-                    if data: px.loadFromData(data)
-                    else: px = None
-                    _cover_cache[b] = px
-                    if not card.isHidden():
-                        card._apply_cover(px)
-                except Exception:
-                    pass
-            _cover_pool.submit(bid, 'list', _cb)
         top_row.addWidget(self.cover_label, 0, Qt.AlignmentFlag.AlignTop)
 
         # info column, mirrors browse card layout exactly
@@ -368,14 +480,11 @@ class BeatmapCard(QFrame):
 
         # title
 
-        artist = bm.get('artist', '')
-        title  = bm.get('title', '')
-        title_lbl = QLabel(f"{artist} — {title}" if (artist or title) else f"#{bid}")
-
-        title_lbl.setStyleSheet(
+        self._title_lbl = QLabel()
+        self._title_lbl.setStyleSheet(
             f"color: {COLOR_TEXT}; font-size: 12px; font-weight: bold; background: transparent; border: none;")
-        title_lbl.setWordWrap(False)
-        info_col.addWidget(title_lbl)
+        self._title_lbl.setWordWrap(False)
+        info_col.addWidget(self._title_lbl)
 
         # tags row: status pill + mode pill + creator
 
@@ -383,13 +492,15 @@ class BeatmapCard(QFrame):
         tags_row.setSpacing(5)
         tags_row.setContentsMargins(0, 0, 0, 0)
 
-        tags_row.addWidget(_tag_label(status_info['name'], status_info['color']))
-        tags_row.addWidget(_tag_label(mode_info['label'], mode_info['color']))
-        creator = bm.get('creator', '')
-        if creator:
-            cr = QLabel(f"by {creator}")
-            cr.setStyleSheet(f"color: {COLOR_TEXT_DIM}; font-size: 11px; background: transparent; border: none;")
-            tags_row.addWidget(cr)
+        self._status_tag = QLabel()
+        self._status_tag.setFixedHeight(18)
+        tags_row.addWidget(self._status_tag)
+        self._mode_tag = QLabel()
+        self._mode_tag.setFixedHeight(18)
+        tags_row.addWidget(self._mode_tag)
+        self._creator_lbl = QLabel()
+        self._creator_lbl.setStyleSheet(f"color: {COLOR_TEXT_DIM}; font-size: 11px; background: transparent; border: none;")
+        tags_row.addWidget(self._creator_lbl)
         tags_row.addStretch()
         info_col.addLayout(tags_row)
 
@@ -399,18 +510,16 @@ class BeatmapCard(QFrame):
         stats_row.setSpacing(12)
         stats_row.setContentsMargins(0, 0, 0, 0)
 
-        if diff_count:
-            stats_row.addWidget(_stat_label(f"♦ {diff_count}", "Difficulties"))
-        if max_length:
-            mins, secs = divmod(max_length, 60)
-            stats_row.addWidget(_stat_label(f"⏱ {mins}:{secs:02d}", "Max length"))
-        if total_sp:
-            stats_row.addWidget(_stat_label(f"◎ {total_sp}", "Total spinners"))
-        id_lbl = QLabel(f"#{bid}")
-
-        id_lbl.setStyleSheet(
+        self._diff_count_lbl = _stat_label('', "Difficulties")
+        stats_row.addWidget(self._diff_count_lbl)
+        self._length_lbl = _stat_label('', "Max length")
+        stats_row.addWidget(self._length_lbl)
+        self._spinners_lbl = _stat_label('', "Total spinners")
+        stats_row.addWidget(self._spinners_lbl)
+        self._id_lbl = QLabel()
+        self._id_lbl.setStyleSheet(
             f"color: {COLOR_TEXT_DIM}50; font-size: 10px; font-family: Consolas; background: transparent; border: none;")
-        stats_row.addWidget(id_lbl)
+        stats_row.addWidget(self._id_lbl)
         stats_row.addStretch()
         info_col.addLayout(stats_row)
 
@@ -422,85 +531,114 @@ class BeatmapCard(QFrame):
         self._mon_badge.setFixedSize(28, 28)
         self._mon_badge.setAlignment(Qt.AlignmentFlag.AlignCenter)
         self._mon_badge.setCursor(Qt.CursorShape.PointingHandCursor)
-        self._update_mon_badge()
         top_row.addWidget(self._mon_badge, 0, Qt.AlignmentFlag.AlignVCenter)
 
         root_layout.addLayout(top_row)
 
-        # diffs section, same indentation as browse
+        # diffs section, same indentation as browse. hidden for beatmaps without diffs
 
-        if diffs:
-            sep_container = QHBoxLayout()
-            sep_container.setContentsMargins(0, 4, 0, 2)
-            sep_line = QFrame()
-            sep_line.setFrameShape(QFrame.Shape.HLine)
-            sep_line.setStyleSheet(f"background: {COLOR_ACCENT}30; border: none;")
-            sep_line.setFixedHeight(1)
-            sep_container.addWidget(sep_line)
-            root_layout.addLayout(sep_container)
-
-            diffs_indent_row = QHBoxLayout()
-            diffs_indent_row.setContentsMargins(106, 0, 0, 0)
-            diffs_indent_row.setSpacing(0)
-
-            diffs_col = QVBoxLayout()
-            diffs_col.setSpacing(2)
-            diffs_col.setContentsMargins(0, 0, 0, 0)
-
-            for diff in diffs:
-                stars = diff.get('stars', 0)
-                star_color = _star_color(stars)
-                d_row = QHBoxLayout()
-                d_row.setSpacing(8)
-                d_row.setContentsMargins(0, 0, 0, 0)
-
-                star_label = QLabel(f"★ {stars:.2f}")
-                star_label.setStyleSheet(
-                    f"color: {star_color}; font-size: 11px; font-weight: bold; background: transparent; min-width: 52px; border: none;")
-                d_row.addWidget(star_label)
-
-                name_label = QLabel(diff.get('name', ''))
-                name_label.setStyleSheet(f"color: {COLOR_TEXT_DIM}; font-size: 11px; background: transparent; border: none;")
-                name_label.setWordWrap(False)
-                d_row.addWidget(name_label, 1)
-
-                diff_length = diff.get('length', 0)
-                diff_mins, diff_secs = divmod(diff_length, 60)
-                time_label = QLabel(f"⏱ {diff_mins}:{diff_secs:02d}")
-                time_label.setStyleSheet(f"color: {COLOR_TEXT_DIM}; font-size: 11px; background: transparent; border: none;")
-                d_row.addWidget(time_label)
-
-                if diff.get('spinners'):
-                    spinner_label = QLabel(f"◎ {diff['spinners']}")
-                    spinner_label.setStyleSheet(f"color: {COLOR_TEXT_DIM}; font-size: 11px; background: transparent; border: none;")
-                    d_row.addWidget(spinner_label)
-
-                diffs_col.addLayout(d_row)
-
-            diffs_indent_row.addLayout(diffs_col)
-            root_layout.addLayout(diffs_indent_row)
+        sep_container = QHBoxLayout()
+        sep_container.setContentsMargins(0, 4, 0, 2)
+        self._sep_line = QFrame()
+        self._sep_line.setFrameShape(QFrame.Shape.HLine)
+        self._sep_line.setStyleSheet(f"background: {COLOR_ACCENT}30; border: none;")
+        self._sep_line.setFixedHeight(1)
+        sep_container.addWidget(self._sep_line)
+        root_layout.addLayout(sep_container)
+
+        diffs_indent_row = QHBoxLayout()
+        diffs_indent_row.setContentsMargins(106, 0, 0, 0)
+        diffs_indent_row.setSpacing(0)
+        self._diffs_lbl = _diffs_label([])
+        diffs_indent_row.addWidget(self._diffs_lbl)
+        root_layout.addLayout(diffs_indent_row)
 
         self.setContextMenuPolicy(Qt.ContextMenuPolicy.CustomContextMenu)
         self.customContextMenuRequested.connect(self.show_context_menu)
 
+        self._fill()
+
+    def _fill(self):
+        bm = self.beatmap
+        bid = bm['id']
+        status_info = _STATUS_BY_ANY.get(bm.get('status_id', 0), BEATMAP_STATUS['0'])
+        mode_info = MODE_INFO.get(bm.get('mode'), MODE_INFO[None])
+        diffs = bm.get('diffs', [])
+        diff_count = bm.get('diff_count', len(diffs))
+        max_length = bm.get('max_length', 0)
+        total_sp = bm.get('total_spinners', 0)
+
+        DIFF_ROW_H = 19
+        diff_section_h = (5 + len(diffs) * DIFF_ROW_H) if diffs else 0
+        self.setFixedHeight(78 + diff_section_h)
+
+        if self._cover_bid != bid:
+            self._cover_bid = bid
+            self._load_cover(bid)
+
+        artist = bm.get('artist', '')
+        title  = bm.get('title', '')
+        self._title_lbl.setText(f"{artist} — {title}" if (artist or title) else f"#{bid}")
+
+        self._status_tag.setPixmap(_tag_pixmap(status_info['name'], status_info['color']))
+        self._mode_tag.setPixmap(_tag_pixmap(mode_info['label'], mode_info['color']))
+        creator = bm.get('creator', '')
+        self._creator_lbl.setText(f"by {creator}")
+        self._creator_lbl.setHidden(not creator)
+
+        self._diff_count_lbl.setText(f"♦ {diff_count}")
+        self._diff_count_lbl.setHidden(not diff_count)
+        mins, secs = divmod(max_length, 60)
+        self._length_lbl.setText(f"⏱ {mins}:{secs:02d}")
+        self._length_lbl.setHidden(not max_length)
+        self._spinners_lbl.setText(f"◎ {total_sp}")
+        self._spinners_lbl.setHidden(not total_sp)
+        self._id_lbl.setText(f"#{bid}")
+
+        diffs_html = _diffs_html(diffs)
+        if diffs_html != self._diffs_lbl.text():
+            self._diffs_lbl.setText(diffs_html)
+        self._sep_line.setHidden(not diffs)
+        self._diffs_lbl.setHidden(not diffs)
+
+        self._update_mon_badge()
+        self._apply_current_style()
+
+    def _load_cover(self, bid):
+        cached = _cover_cache_find(bid)
+        if cached is not None or bid in _cover_missing:
+            self._apply_cover(cached)
+            return
+        self.cover_label.setText("...")
+        self._set_cover_css(_COVER_LOADING_CSS)
+        def _cb(b, data, card=self):
+            try:
+                px = _cover_cache_store(b, data)
+                # a pooled card may have been hidden or reused for another beatmap meanwhile
+
+                if not card.isHidden() and card._cover_bid == b:
+                    card._apply_cover(px)
+            except Exception:
+                pass
+        _cover_pool.submit(bid, 'list', _cb)
+
+    def _set_cover_css(self, css):
+        if self.cover_label.styleSheet() != css:
+            self.cover_label.setStyleSheet(css)
+
     def _on_cover_loaded(self, bid, data):
         try:
-            pixmap = None
-            if data is not None:
-                pixmap = QPixmap()
-                pixmap.loadFromData(data)
-            _cover_cache[bid] = pixmap
-            self._apply_cover(pixmap)
+            self._apply_cover(_cover_cache_store(bid, data))
         except RuntimeError:
             pass
 
     def _apply_cover(self, pixmap):
         if not pixmap:
             self.cover_label.setText("N/A")
-            self.cover_label.setStyleSheet(
-                f"background: {COLOR_CARD}; border-radius: 6px; color: {COLOR_TEXT_DIM}; font-size: 9px;")
+            self._set_cover_css(_COVER_MISSING_CSS)
             return
-        self.cover_label.setPixmap(_scale_cover(pixmap, 96, 62))
+        self._set_cover_css(_COVER_CSS)
+        self.cover_label.setPixmap(_scaled_cover(self._cover_bid, pixmap, 96, 62))
 
     def mousePressEvent(self, event):
         if event.button() == Qt.MouseButton.LeftButton:
@@ -542,11 +680,7 @@ class BeatmapCard(QFrame):
 
     def enterEvent(self, event):
         if not self._is_selected:
-            hover_style = f"""
-                QFrame {{ background: {COLOR_BG_LIGHT}; border: 2px solid {COLOR_ACCENT}60; border-radius: 10px; }}
-                QLabel {{ background: transparent; border: none; color: {COLOR_TEXT}; }}
-            """
-            self.setStyleSheet(hover_style)
+            _set_card_state(self, 'hover')
         super().enterEvent(event)
 
     def leaveEvent(self, event):
@@ -554,11 +688,10 @@ class BeatmapCard(QFrame):
         super().leaveEvent(event)
 
     def _apply_current_style(self):
-        mon = self.beatmap.get("monitored", False)
         if self._is_selected:
-            self.setStyleSheet(self._mon_sel_style if mon else self._sel_style)
+            _set_card_state(self, 'selected')
         else:
-            self.setStyleSheet(self._mon_style if mon else self._base_style)
+            _set_card_state(self, 'monitored' if self.beatmap.get("monitored", False) else 'base')
 
     def _update_mon_badge(self):
         mon = self.beatmap.get("monitored", False)
@@ -583,12 +716,14 @@ class BeatmapCard(QFrame):
         self._update_mon_badge()
         self._apply_current_style()
 
-    def refresh_data(self, beatmap):
-        # update card data and refresh visual state without rebuilding layout
+    def refresh_data(self, beatmap, index=None):
+        # point the card at beatmap (and index) and refresh every label in place,
+        # used for data updates and when a pooled card is reused
 
         self.beatmap = beatmap
-        self._update_mon_badge()
-        self._apply_current_style()
+        if index is not None:
+            self.index = index
+        self._fill()
 
     def show_context_menu(self, pos):
         menu = QMenu(self)
@@ -690,6 +825,52 @@ class BeatmapCard(QFrame):
 
 
 
+class _BrowseCard(QFrame):
+    # browse result card. events are forwarded to the owning main window, which
+    # keeps the browse selection; the card only carries its beatmap data
+
+    _hint_lbl = None
+
+    def __init__(self, owner, bm, already):
+        super().__init__()
+        self._owner = owner
+        self._bid = bm['id']
+        self._bm_data = bm
+        self._already = already
+
+    def mousePressEvent(self, event):
+        # click = select (shift = range, ctrl = multi)
+
+        if self._already:
+            return super().mousePressEvent(event)
+        if event.button() != Qt.MouseButton.LeftButton:
+            return
+        modifiers = event.modifiers()
+        self._owner._browse_toggle_selection(
+            self._bid, self,
+            shift=bool(modifiers & Qt.KeyboardModifier.ShiftModifier),
+            ctrl=bool(modifiers & Qt.KeyboardModifier.ControlModifier))
+
+    def mouseDoubleClickEvent(self, event):
+        # double click = add to tracking
+
+        if self._already:
+            return super().mouseDoubleClickEvent(event)
+        if event.button() == Qt.MouseButton.LeftButton:
+            self._owner._do_add_browse_card(self._bid, self._bm_data, self)
+
+    def enterEvent(self, event):
+        self._owner._browse_card_hover(self, True)
+        super().enterEvent(event)
+
+    def leaveEvent(self, event):
+        self._owner._browse_card_hover(self, False)
+        super().leaveEvent(event)
+
+    def contextMenuEvent(self, event):
+        self._owner._show_browse_context_menu(self, event.globalPos())
+
+
 class FirstRunDialog(QDialog):
     # shown once on first launch to let the user pick where to store config and sound
 
@@ -1206,11 +1387,11 @@ class SettingsDialog(QDialog):
                         else:
                             # check again in 100ms
 
-                            QTimer.singleShot(100, check_sound_finished)
+                            QTimer.singleShot(100, Qt.TimerType.CoarseTimer, check_sound_finished)
 
                 # start checking
 
-                QTimer.singleShot(100, check_sound_finished)
+                QTimer.singleShot(100, Qt.TimerType.CoarseTimer, check_sound_finished)
 
             except Exception as e:
                 self.test_sound_btn.setText(f"Error: {str(e)[:30]}")
@@ -1313,7 +1494,7 @@ class HistoryDialog(QDialog):
         self.client_secret = client_secret
         self.utc_offset = utc_offset
         self.on_history_changed = on_history_changed
-        self.filtered_history = history[:]
+        self.filtered_history = list(history)
         self.setWindowTitle("Status change history")
         self.setModal(True)
         self.setMinimumSize(1100, 600)
@@ -1329,10 +1510,10 @@ class HistoryDialog(QDialog):
 
     # helpers
 
-    def _apply_history_cover(self, label, pixmap):
+    def _apply_history_cover(self, label, pixmap, bid):
         if not pixmap:
             return
-        label.setPixmap(_scale_cover(pixmap, 88, 54))
+        label.setPixmap(_scaled_cover(bid, pixmap, 88, 54))
 
     def _menu_style(self):
         return _menu_style_base()
@@ -1492,11 +1673,17 @@ class HistoryDialog(QDialog):
 
         ]
 
+        # active stylesheet per colour, built once instead of on every refresh
+
+        _active_per_color = {COLOR_ACCENT: _active_style(COLOR_ACCENT)}
+        _sf_color_map = {v: col for _, v, col in filter_statuses_list}
+        _active_per_color.update({col: _active_style(col) for col in _sf_color_map.values()})
+
         def _refresh_sf():
             for k, b in self.filter_btns.items():
-                c = dict((v, col) for _, v, col in filter_statuses_list).get(k, COLOR_ACCENT)
+                c = _sf_color_map.get(k, COLOR_ACCENT)
                 active = len(self.filter_statuses) == 0 if k is None else k in self.filter_statuses
-                b.setStyleSheet(_active_style(c) if active else filter_btn_inactive)
+                b.setStyleSheet(_active_per_color[c] if active else filter_btn_inactive)
 
         def make_filter_handler(val):
             def handler():
@@ -1511,7 +1698,7 @@ class HistoryDialog(QDialog):
         for label, val, color in filter_statuses_list:
             btn = QPushButton(label)
             btn.setCursor(Qt.CursorShape.PointingHandCursor)
-            btn.setStyleSheet(_active_style(COLOR_ACCENT) if val is None else filter_btn_inactive)
+            btn.setStyleSheet(_active_per_color[COLOR_ACCENT] if val is None else filter_btn_inactive)
             btn.clicked.connect(make_filter_handler(val))
             self.filter_btns[val] = btn
             controls_row.addWidget(btn)
@@ -1538,11 +1725,14 @@ class HistoryDialog(QDialog):
 
         ]
 
+        _mf_color_map = {v: col for _, v, col in hist_mode_filters}
+        _active_per_color.update({col: _active_style(col) for col in _mf_color_map.values()})
+
         def _refresh_mf():
             for k, b in self.history_mode_btns.items():
-                c = dict((v, col) for _, v, col in hist_mode_filters).get(k, COLOR_ACCENT)
+                c = _mf_color_map.get(k, COLOR_ACCENT)
                 active = len(self.history_mode_filters) == 0 if k is None else k in self.history_mode_filters
-                b.setStyleSheet(_active_style(c) if active else filter_btn_inactive)
+                b.setStyleSheet(_active_per_color[c] if active else filter_btn_inactive)
 
         def make_hist_mode_handler(val):
             def handler():
@@ -1557,7 +1747,7 @@ class HistoryDialog(QDialog):
         for label, val, color in hist_mode_filters:
             btn = QPushButton(label)
             btn.setCursor(Qt.CursorShape.PointingHandCursor)
-            btn.setStyleSheet(_active_style(color) if val is None else filter_btn_inactive)
+            btn.setStyleSheet(_active_per_color[color] if val is None else filter_btn_inactive)
             btn.clicked.connect(make_hist_mode_handler(val))
             self.history_mode_btns[val] = btn
             mode_row.addWidget(btn)
@@ -1751,7 +1941,7 @@ class HistoryDialog(QDialog):
             return
         try:
             with open(path, 'w', encoding='utf-8') as f:
-                json.dump(self.history, f, indent=2, ensure_ascii=False)
+                json.dump(list(self.history), f, indent=2, ensure_ascii=False)
             self.count_label.setText(f"Exported {len(self.history)} entries to {os.path.basename(path)}")
         except Exception as e:
             self.count_label.setText(f"Export error: {e}")
@@ -1770,14 +1960,19 @@ class HistoryDialog(QDialog):
             # merge, avoid duplicates by timestamp+beatmap id key
 
             existing_keys = {(e.get('timestamp'), e.get('beatmap_id')) for e in self.history}
+            merged = list(self.history)
             added = 0
             for entry in imported:
                 key = (entry.get('timestamp'), entry.get('beatmap_id'))
                 if key not in existing_keys:
-                    self.history.insert(0, entry)
+                    merged.append(entry)
                     existing_keys.add(key)
                     added += 1
-            self.history.sort(key=lambda x: x.get('timestamp', 0), reverse=True)
+            # history is a bounded deque, refill it newest first so the oldest fall off
+
+            merged.sort(key=lambda x: x.get('timestamp', 0), reverse=True)
+            self.history.clear()
+            self.history.extend(merged[:self.history.maxlen])
             self.apply_filters()
             self.count_label.setText(f"Imported {added} new entries")
             if self.on_history_changed:
@@ -1857,7 +2052,7 @@ class HistoryDialog(QDialog):
 
     def apply_filters(self):
         query = self.search_input.text().lower().strip()
-        _url_match = re.search(r'/beatmapsets?/(\d+)', query)
+        _url_match = _BMS_ID_RE.search(query)
         id_from_url = _url_match.group(1) if _url_match else None
         status_fs = getattr(self, 'filter_statuses', set())
         mode_fs   = getattr(self, 'history_mode_filters', set())
@@ -1884,43 +2079,59 @@ class HistoryDialog(QDialog):
 
         self.table.setRowCount(len(self.filtered_history))
         self.table.setUpdatesEnabled(False)
+
+        def _set_text(row, col, text):
+            # reuse the item already in the cell, only create one for new rows
+
+            item = self.table.item(row, col)
+            if item is None:
+                self.table.setItem(row, col, QTableWidgetItem(text))
+            else:
+                item.setText(text)
+
         for i, entry in enumerate(self.filtered_history):
             bid = str(entry.get('beatmap_id', ''))
 
             # col 0, cover image (from cache or async load)
 
-            cover_label = QLabel()
-            cover_label.setFixedSize(88, 54)
-            cover_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-            cover_label.setStyleSheet(f"background-color: {COLOR_BG}; border-radius: 4px;")
-            if bid:
-                if bid in _cover_cache:
-                    self._apply_history_cover(cover_label, _cover_cache[bid])
+            # rows without a cover get the shared placeholder, no per row widgets
+
+            if not bid or bid in _cover_missing:
+                self.table.removeCellWidget(i, 0)
+                placeholder_item = QTableWidgetItem()
+                placeholder_item.setData(Qt.ItemDataRole.DecorationRole, _cover_placeholder())
+                self.table.setItem(i, 0, placeholder_item)
+            else:
+                self.table.takeItem(i, 0)
+                cover_label = QLabel()
+                cover_label.setFixedSize(88, 54)
+                cover_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
+                cover_label.setStyleSheet(f"background-color: {COLOR_BG}; border-radius: 4px;")
+                cached = _cover_cache_find(bid)
+                if cached is not None:
+                    self._apply_history_cover(cover_label, cached, bid)
                 else:
                     def _hcb(b, data, lbl=cover_label, win=self):
                         try:
-                            pix = QPixmap()
-                            if data: pix.loadFromData(data)
-                            else: pix = None
-                            _cover_cache[b] = pix
-                            win._apply_history_cover(lbl, pix)
+                            pix = _cover_cache_store(b, data)
+                            win._apply_history_cover(lbl, pix, b)
                         except Exception:
                             pass
                     _cover_pool.submit(bid, 'card', _hcb)
-            # wrap in container to fix alignment
+                # wrap in container to fix alignment
 
-            container = QWidget()
-            container.setStyleSheet("background-color: transparent;")
-            container_layout = QHBoxLayout(container)
-            container_layout.setContentsMargins(1, 1, 1, 1)
-            container_layout.setAlignment(Qt.AlignmentFlag.AlignCenter)
-            container_layout.addWidget(cover_label)
-            self.table.setCellWidget(i, 0, container)
+                container = QWidget()
+                container.setStyleSheet("background-color: transparent;")
+                container_layout = QHBoxLayout(container)
+                container_layout.setContentsMargins(1, 1, 1, 1)
+                container_layout.setAlignment(Qt.AlignmentFlag.AlignCenter)
+                container_layout.addWidget(cover_label)
+                self.table.setCellWidget(i, 0, container)
 
             # col 1, detected
 
             detected = time.strftime('%Y-%m-%d %H:%M:%S', time.localtime(entry['timestamp']))
-            self.table.setItem(i, 1, QTableWidgetItem(detected))
+            _set_text(i, 1, detected)
 
             # col 2, site date, adjusted by user utc offset
 
@@ -1928,17 +2139,21 @@ class HistoryDialog(QDialog):
             if site_date and str(site_date).strip() not in ('', 'None', '—'):
                 try:
                     raw = str(site_date).strip()
-                    # try multiple formats: osu! api returns iso 8601 
-
-                    # older stored entries may have space separated format
+                    # osu! api returns iso 8601, older stored entries may have space separated format
 
-                    for fmt in ('%Y-%m-%dT%H:%M:%SZ', '%Y-%m-%dT%H:%M:%S+00:00',
-                                '%Y-%m-%dT%H:%M:%S', '%Y-%m-%d %H:%M:%S'):
-                        try:
-                            dt = datetime.strptime(raw, fmt)
-                            break
-                        except ValueError:
-                            dt = None
+                    m = _ISO_RE.match(raw)
+                    if m:
+                        dt = datetime(*map(int, m.groups()))
+                    else:
+                        # unpadded fields etc, fall back to strptime
+
+                        for fmt in ('%Y-%m-%dT%H:%M:%SZ', '%Y-%m-%dT%H:%M:%S+00:00',
+                                    '%Y-%m-%dT%H:%M:%S', '%Y-%m-%d %H:%M:%S'):
+                            try:
+                                dt = datetime.strptime(raw, fmt)
+                                break
+                            except ValueError:
+                                dt = None
                     if dt is None:
                         raise ValueError(f"Cannot parse date: {raw}")
                     dt_adjusted = dt + timedelta(hours=self.utc_offset)
@@ -1948,20 +2163,19 @@ class HistoryDialog(QDialog):
                     site_date_str = str(site_date).strip()
             else:
                 site_date_str = '—'
-            self.table.setItem(i, 2, QTableWidgetItem(site_date_str))
+            _set_text(i, 2, site_date_str)
 
             # col 3, beatmap
 
-            self.table.setItem(i, 3, QTableWidgetItem(entry['title']))
+            _set_text(i, 3, entry['title'])
 
             # col 4, mapper
 
-            self.table.setItem(i, 4, QTableWidgetItem(entry['creator']))
+            _set_text(i, 4, entry['creator'])
 
             # col 5, status change
 
-            self.table.setItem(i, 5, QTableWidgetItem(
-                f"{entry['old_status']} → {entry['new_status']}"))
+            _set_text(i, 5, f"{entry['old_status']} → {entry['new_status']}")
 
             # col 6, link button
 
@@ -1993,31 +2207,201 @@ class HistoryDialog(QDialog):
             f"Showing {len(self.filtered_history)} of {len(self.history)} entries")
 
 
+# main window keyboard shortcuts: (key sequence, slot method name)
+
+_SHORTCUTS = (
+    # universal
+
+    ("Ctrl+A",       "_shortcut_select_all"),
+    ("Ctrl+Z",       "_shortcut_escape"),
+    ("Delete",       "_shortcut_delete_selected"),
+
+    # enter
+
+    ("Return",       "_shortcut_enter"),
+    ("Enter",        "_shortcut_enter"),
+    ("Ctrl+Return",  "_shortcut_ctrl_enter"),
+    ("Ctrl+Enter",   "_shortcut_ctrl_enter"),
+
+    # refresh
+
+    ("Ctrl+R",       "refresh_all_beatmaps"),
+)
+
+# browse cards are built in batches of this size as the list is scrolled
+
+_BROWSE_CARD_BATCH = 30
+
+# tracked cards likewise, only the first batches of the filtered list get a widget
+
+_TRACKED_CARD_BATCH = 30
+
+# hidden tracked cards kept for reuse across rebuilds instead of being deleted
+
+_TRACKED_CARD_POOL_SIZE = 256
+
+# api pages kept per (query, mode, status, sort, cursor) and how long they stay fresh
+
+_BROWSE_PAGE_CACHE_SIZE = 64
+_BROWSE_PAGE_TTL = 60.0
+
+# status filter id -> osu! api search status name
+
+_STATUS_ID_TO_BROWSE = {'1': 'ranked', '3': 'qualified', '4': 'loved', '0': 'pending', '-1': 'wip', '-2': 'graveyard'}
+
+# sort button index -> osu! api sort param
+
+_BROWSE_SORT_MAP = (
+    'ranked_desc',  # newest
+
+    'ranked_asc',  # oldest
+
+    'ranked_desc',  # status (no direct api equiv, use ranked desc)
+
+    'title_asc',  # title
+
+    'creator_asc',  # mapper
+
+    'difficulty_desc',  # stars ↓
+
+    'difficulty_asc',  # stars ↑
+
+    'ranked_desc',  # most diffs (no api equiv)
+
+)
+
+
+# status sort order for the tracked list, ranked first. keyed by both the
+# string and int ids like _STATUS_BY_ANY
+
+_STATUS_SORT_ORDER = {'1': 0, '3': 1, '4': 2, '0': 3, '-1': 4, '-2': 5}
+_STATUS_SORT_ORDER.update({int(k): v for k, v in _STATUS_SORT_ORDER.items()})
+
+
+def _top_stars(bm):
+    diffs = bm.get('diffs')
+    return diffs[0].get('stars', 0) if diffs else 0
+
+
+# sort button index -> (key on a tracked beatmap, descending). sort() evaluates
+# the key once per beatmap, ties keep their list order in both directions
+
+_TRACKED_SORTS = (
+    (lambda bm: bm.get('added_at', 0), True),  # newest
+
+    (lambda bm: bm.get('added_at', 0), False),  # oldest
+
+    (lambda bm: _STATUS_SORT_ORDER.get(bm.get('status_id', 0), 99), False),  # status
+
+    (lambda bm: f"{bm.get('artist', '')} - {bm.get('title', '')}".lower(), False),  # title
+
+    (lambda bm: bm.get('creator', '').lower(), False),  # mapper
+
+    (_top_stars, True),  # stars ↓
+
+    (_top_stars, False),  # stars ↑
+
+    (lambda bm: bm.get('diff_count', 0), True),  # most diffs
+
+)
+
+
+def _browse_normalize(bm):
+    # store the string status / mode keys _browse_passes_filters reads, once per result
+
+    bm['_status_id_s'] = str(bm.get('status_id', ''))
+    bm['_mode_s'] = str(bm.get('mode', ''))
+    bm['_modes_s'] = frozenset(str(m) for m in bm.get('modes', []))
+    return bm
+
+
+def _browse_passes_filters(bm, status_fs, mode_fs):
+    # client side status / mode filter for one browse result, empty set means all.
+    # reads the string keys _browse_normalize stores on every result
+
+    if status_fs and bm['_status_id_s'] not in status_fs:
+        return False
+    return not mode_fs or bm['_mode_s'] in mode_fs or not mode_fs.isdisjoint(bm['_modes_s'])
+
+
+def _narrows(new, old):
+    # true when filter set new admits a subset of what old admitted
+
+    return new == old or (bool(new) and (not old or new <= old))
+
+
 class MainWindow(QMainWindow):
     def __init__(self):
         super().__init__()
         self.config = load_config()
         self.beatmaps = self.config.get('beatmaps', [])
-        self.history = self.config.get('history', [])
+        # newest first, appendleft drops the oldest entry past 100 in O(1)
+
+        self.history = deque(self.config.get('history', []), maxlen=100)
+        self.config['history'] = self.history
         self.selected_index = None
         self._selected_card_indices = set()  # multi select in tracked
 
         self._last_clicked_index = None  # for shift+click range select
 
+        self._tracked_filtered = []  # (index, beatmap) in display order, cards exist for a prefix
+        self._tracked_realized = _TRACKED_CARD_BATCH
+        self._tracked_filter_key = None
+        self._list_dirty = False  # a rebuild was skipped while the tracked list was hidden
+
+        self._tracked_rebuild_pending = False  # a full rebuild is queued for this event loop pass
+
+        self._tracked_cards = []  # built BeatmapCards in display order
+
+        self._card_pool = []  # hidden BeatmapCards waiting to be reused
+
+        self._info_dialog = None  # InfoDialog is static, built on the first open and reused
+
+        self._current_card_ids = set()  # their indices, compared against each update
+
+        self._haystacks = {}  # bid -> lowercased search text, artist/title/creator never change after add
+
         self.is_monitoring = False
         self.sort_index = 0
         self.status_filters = set()
         self.mode_filters = set()
 
-        # ensure all beatmaps have 'monitored' field
+        # browse api requests share a small pool, which also keeps us polite to the api
+
+        self._browse_pool = QThreadPool(self)
+        self._browse_pool.setMaxThreadCount(4)
+
+        # config saves are throttled to one write per 500 ms, done by a single writer thread
+
+        self._save_pool = QThreadPool(self)
+        self._save_pool.setMaxThreadCount(1)
+        self._save_timer = QTimer(self)
+        self._save_timer.setTimerType(Qt.TimerType.CoarseTimer)
+        self._save_timer.setSingleShot(True)
+        self._save_timer.setInterval(500)
+        self._save_timer.timeout.connect(self._flush_config)
+
+        # ensure all beatmaps have 'monitored' field. status ids are kept as the same
+        # interned strings the api path produces, old configs may hold ints
 
         for beatmap in self.beatmaps:
             if 'monitored' not in beatmap:
                 beatmap['monitored'] = False  # default to not monitored for old entries
+            beatmap['status_id'] = sys.intern(str(beatmap.get('status_id', '0')))
+
+        # ids of tracked beatmaps, kept in step with self.beatmaps
+
+        self._tracked_ids = {b['id'] for b in self.beatmaps}
+        self._monitored_count = sum(1 for b in self.beatmaps if b.get('monitored', False))
 
+        # notifications get channel 0 to themselves, so "still playing" is one
+        # channel query instead of a scan of every mixer channel
 
+        self._notify_channel = None
         try:
             pygame.mixer.init()
+            pygame.mixer.set_reserved(1)
+            self._notify_channel = pygame.mixer.Channel(0)
         except Exception:
             pass
 
@@ -2093,27 +2477,8 @@ class MainWindow(QMainWindow):
         self._setup_shortcuts()
 
     def _setup_shortcuts(self):
-        def sc(key, slot):
-            shortcut = QShortcut(QKeySequence(key), self)
-            shortcut.activated.connect(slot)
-            return shortcut
-
-        # universal
-
-        sc("Ctrl+A",    self._shortcut_select_all)
-        sc("Ctrl+Z",    self._shortcut_escape)
-        sc("Delete",    self._shortcut_delete_selected)
-
-        # enter
-
-        sc("Return",       self._shortcut_enter)
-        sc("Enter",        self._shortcut_enter)
-        sc("Ctrl+Return",  self._shortcut_ctrl_enter)
-        sc("Ctrl+Enter",   self._shortcut_ctrl_enter)
-
-        # refresh
-
-        sc("Ctrl+R",       self.refresh_all_beatmaps)
+        for key, slot_name in _SHORTCUTS:
+            QShortcut(QKeySequence(key), self).activated.connect(getattr(self, slot_name))
 
     def _shortcut_select_all(self):
         if self._active_tab == "browse":
@@ -2359,7 +2724,13 @@ class MainWindow(QMainWindow):
             }}
             QLineEdit:focus {{ border: 2px solid {COLOR_ACCENT}; }}
         """)
-        self.search_bar.textChanged.connect(self._on_unified_search)
+        # typing only filters once the keystrokes pause
+
+        self._search_debounce = QTimer(self)
+        self._search_debounce.setSingleShot(True)
+        self._search_debounce.setInterval(120)
+        self._search_debounce.timeout.connect(self._on_unified_search)
+        self.search_bar.textChanged.connect(self._search_debounce.start)
         self.search_bar.setContextMenuPolicy(Qt.ContextMenuPolicy.CustomContextMenu)
         self.search_bar.customContextMenuRequested.connect(self._search_bar_context_menu)
         layout.addWidget(self.search_bar)
@@ -2382,6 +2753,9 @@ class MainWindow(QMainWindow):
             }}
             QPushButton:hover {{ background: {COLOR_BG_LIGHT}; color: {COLOR_TEXT}; }}
         """
+        # active filter stylesheet per colour, filled once per filter row below
+
+        _sf_active_per_color = {COLOR_ACCENT: sf_active.replace("{color}", COLOR_ACCENT)}
         sort_active_s = f"""
             QPushButton {{
                 background: {COLOR_ACCENT}; color: #000; border: none;
@@ -2453,6 +2827,7 @@ class MainWindow(QMainWindow):
 
         ]
         _sf_color_map = {v: c for _, v, c in _status_defs}
+        _sf_active_per_color.update({c: sf_active.replace("{color}", c) for c in _sf_color_map.values()})
         _sf_name_map  = {v: l for l, v, c in _status_defs}
 
         def _update_filters_summary():
@@ -2470,11 +2845,11 @@ class MainWindow(QMainWindow):
         def _refresh_sf():
             all_a = len(self.status_filters) == 0
             self.status_filter_btns[None].setStyleSheet(
-                sf_active.replace("{color}", COLOR_ACCENT) if all_a else sf_inactive)
+                _sf_active_per_color[COLOR_ACCENT] if all_a else sf_inactive)
             for k, b in self.status_filter_btns.items():
                 if k is None: continue
                 c = _sf_color_map.get(k, COLOR_ACCENT)
-                b.setStyleSheet(sf_active.replace("{color}", c) if k in self.status_filters else sf_inactive)
+                b.setStyleSheet(_sf_active_per_color[c] if k in self.status_filters else sf_inactive)
             _update_filters_summary()
 
         def make_sf(val):
@@ -2489,7 +2864,7 @@ class MainWindow(QMainWindow):
         for label, val, color in _status_defs:
             btn = QPushButton(label)
             btn.setCursor(Qt.CursorShape.PointingHandCursor)
-            btn.setStyleSheet(sf_active.replace("{color}", COLOR_ACCENT) if val is None else sf_inactive)
+            btn.setStyleSheet(_sf_active_per_color[COLOR_ACCENT] if val is None else sf_inactive)
             btn.clicked.connect(make_sf(val))
             self.status_filter_btns[val] = btn
             status_row.addWidget(btn)
@@ -2514,15 +2889,16 @@ class MainWindow(QMainWindow):
 
         ]
         _mf_color_map = {v: c for _, v, c in _mode_defs}
+        _sf_active_per_color.update({c: sf_active.replace("{color}", c) for c in _mf_color_map.values()})
 
         def _refresh_mf():
             all_a = len(self.mode_filters) == 0
             self.mode_filter_btns[None].setStyleSheet(
-                sf_active.replace("{color}", COLOR_ACCENT) if all_a else sf_inactive)
+                _sf_active_per_color[COLOR_ACCENT] if all_a else sf_inactive)
             for k, b in self.mode_filter_btns.items():
                 if k is None: continue
                 c = _mf_color_map.get(k, COLOR_ACCENT)
-                b.setStyleSheet(sf_active.replace("{color}", c) if k in self.mode_filters else sf_inactive)
+                b.setStyleSheet(_sf_active_per_color[c] if k in self.mode_filters else sf_inactive)
             _update_filters_summary()
 
         def make_mf(val):
@@ -2537,7 +2913,7 @@ class MainWindow(QMainWindow):
         for label, val, color in _mode_defs:
             btn = QPushButton(label)
             btn.setCursor(Qt.CursorShape.PointingHandCursor)
-            btn.setStyleSheet(sf_active.replace("{color}", COLOR_ACCENT) if val is None else sf_inactive)
+            btn.setStyleSheet(_sf_active_per_color[COLOR_ACCENT] if val is None else sf_inactive)
             btn.clicked.connect(make_mf(val))
             self.mode_filter_btns[val] = btn
             mode_row.addWidget(btn)
@@ -2563,13 +2939,25 @@ class MainWindow(QMainWindow):
         """
         self.sort_buttons = []
 
+        def _highlighted_sort(i):
+            # in browse an unsupported sort is shown on the newest button
+
+            if i in _BROWSE_DISABLED_SORTS and self._active_tab == "browse":
+                return 0
+            return i
+
         def make_sort(idx):
             def h():
+                # only the previously highlighted and the new button change style
+
+                # _switch_tab does the full re-evaluation for disabled sorts
+
+                prev_btn = _highlighted_sort(self.sort_index)
                 self.sort_index = idx
-                for i2, b2 in enumerate(self.sort_buttons):
-                    if i2 in _BROWSE_DISABLED_SORTS and self._active_tab == "browse":
-                        continue
-                    b2.setStyleSheet(sort_active_s if i2 == idx else sort_inactive_s)
+                new_btn = _highlighted_sort(idx)
+                if prev_btn != new_btn:
+                    self.sort_buttons[prev_btn].setStyleSheet(sort_inactive_s)
+                    self.sort_buttons[new_btn].setStyleSheet(sort_active_s)
                 _update_filters_summary()
                 self.update_beatmap_list()
                 if self._active_tab == "browse":
@@ -2644,6 +3032,8 @@ class MainWindow(QMainWindow):
             self._active_tab = name
             self._tab_tracked_btn.setStyleSheet(tab_active_s if name == "tracked" else tab_inactive_s)
             self._tab_browse_btn.setStyleSheet(tab_active_s if name == "browse" else tab_inactive_s)
+            if name == "browse" and not self._browse_built:
+                self._build_browse_container()
             self._tab_stack.setCurrentIndex(0 if name == "tracked" else 1)
             self._bulk_row_widget.setVisible(name == "tracked")
             # disable sort buttons that have no browse api equivalent
@@ -2660,7 +3050,7 @@ class MainWindow(QMainWindow):
                 self.sort_buttons[0].setStyleSheet(sort_active_s)
             elif name == "tracked":
                 self.sort_buttons[0].setStyleSheet(sort_active_s if self.sort_index == 0 else sort_inactive_s)
-            if name == "browse" and not getattr(self, '_browse_fetched', False):
+            if name == "browse" and not self._browse_fetched:
                 self._browse_fetched = True
                 self._browse_reset_and_fetch()
 
@@ -2692,15 +3082,75 @@ class MainWindow(QMainWindow):
             {_scrollbar_style()}
         """)
         self.beatmap_container = QWidget()
-        self.beatmap_container.setStyleSheet("background: transparent;")
+        self.beatmap_container.setObjectName("trackedCards")
+        self.beatmap_container.setStyleSheet(_TRACKED_CARDS_STYLE)
         self.beatmap_layout = QVBoxLayout(self.beatmap_container)
         self.beatmap_layout.setSpacing(4)
         self.beatmap_layout.setContentsMargins(0, 0, 0, 0)
         tracked_scroll.setWidget(self.beatmap_container)
         tracked_layout.addWidget(tracked_scroll)
+        tracked_scroll.verticalScrollBar().valueChanged.connect(self._tracked_on_scroll)
+        self._tracked_scroll = tracked_scroll
+
+        def _tracked_shown(event):
+            QWidget.showEvent(self._tracked_container, event)
+            if self._list_dirty:
+                self.update_beatmap_list(full_rebuild=True)
+        self._tracked_container.showEvent = _tracked_shown
+
+        self._tab_stack = QStackedWidget()
+        self._tab_stack.addWidget(self._tracked_container)  # index 0 = tracked
+
+        self._tab_stack.addWidget(QWidget())  # index 1 = browse, built on first open
+
+        layout.addWidget(self._tab_stack)
+
+        # browse state
+
+        self._browse_results_by_status = {}
+        self._browse_pending = set()  # statuses with a page request in flight (parallel)
+
+        self._browse_cursors = {}  # status -> next cursor string
+
+        self._browse_loaders = []
+        self._browse_card_by_id = {}  # bid -> card widget, in display order
+
+        self._browse_merged = []  # filtered results, cards exist only for a prefix of it
 
-        # browse scroll area
+        self._browse_realized = _BROWSE_CARD_BATCH
+        self._last_scroll_check = 0.0
+        self._browse_rebuild_pending = False
+        self._browse_dirty = False  # same as _list_dirty for the browse cards
+        self._browse_last_filters = (frozenset(), frozenset())  # filters the cards were built with
+        self._browse_page_cache = OrderedDict()  # page key -> (fetched at, beatmaps), lru
 
+        self._browse_fetch_gen = 0
+        self._browse_cursor = None
+        self._browse_built = False
+        self._browse_fetched = False
+        self._browse_loading = False
+        self._browse_selected_ids = set()
+        self._browse_last_clicked_id = None
+        self._browse_api_query = ''
+        self._browse_api_mode = None
+        self._browse_api_status = ''
+        self._browse_api_statuses = set()  # set when multiple statuses selected
+        self._browse_lookup_id = False  # query is a beatmapset id / url, its result skips client filters
+
+        self._browse_api_sort = 'ranked_desc'
+        self._browse_search_timer = QTimer()
+        self._browse_search_timer.setSingleShot(True)
+        self._browse_search_timer.timeout.connect(self._browse_reset_and_fetch)
+
+        widget.setLayout(layout)
+        self.update_beatmap_list()
+        return widget
+
+    def _build_browse_container(self):
+        # browse widgets are only built when the tab is first opened, most sessions
+        # never leave the tracked list
+
+        self._browse_built = True
         self._browse_container = QWidget()
         browse_outer = QVBoxLayout(self._browse_container)
         browse_outer.setContentsMargins(0, 0, 0, 0)
@@ -2752,7 +3202,8 @@ class MainWindow(QMainWindow):
             {_scrollbar_style()}
         """)
         self._browse_cards_widget = QWidget()
-        self._browse_cards_widget.setStyleSheet("background: transparent;")
+        self._browse_cards_widget.setObjectName("browseCards")
+        self._browse_cards_widget.setStyleSheet(_BROWSE_CARDS_STYLE)
         self._browse_cards_layout = QVBoxLayout(self._browse_cards_widget)
         self._browse_cards_layout.setSpacing(4)
         self._browse_cards_layout.setContentsMargins(0, 0, 0, 0)
@@ -2765,53 +3216,28 @@ class MainWindow(QMainWindow):
         self._browse_scroll.verticalScrollBar().valueChanged.connect(
             self._browse_on_scroll)
 
-        self._tab_stack = QStackedWidget()
-        self._tab_stack.addWidget(self._tracked_container)  # index 0 = tracked
-
-        self._tab_stack.addWidget(self._browse_container)  # index 1 = browse
+        def _browse_shown(event):
+            QWidget.showEvent(self._browse_container, event)
+            if self._browse_dirty:
+                self._browse_rebuild_from_cache()
+        self._browse_container.showEvent = _browse_shown
 
-        layout.addWidget(self._tab_stack)
+        placeholder = self._tab_stack.widget(1)
+        self._tab_stack.insertWidget(1, self._browse_container)  # index 1 = browse
 
-        # browse state
-
-        self._browse_results_by_status = {}
-        self._browse_worker = None
-        self._browse_workers = {}  # status -> active worker (parallel)
-
-        self._browse_cursors = {}  # status -> next cursor string
-
-        self._browse_loaders = []
-        self._browse_fetch_gen = 0
-        self._browse_cursor = None
-        self._browse_fetched = False
-        self._browse_loading = False
-        self._browse_selected_ids = set()
-        self._browse_last_clicked_id = None
-        self._browse_api_query = ''
-        self._browse_api_mode = None
-        self._browse_api_status = ''
-        self._browse_api_statuses = set()  # set when multiple statuses selected
-
-        self._browse_api_sort = 'ranked_desc'
-        self._browse_search_timer = QTimer()
-        self._browse_search_timer.setSingleShot(True)
-        self._browse_search_timer.timeout.connect(self._browse_reset_and_fetch)
-
-        widget.setLayout(layout)
-        self.update_beatmap_list()
-        return widget
+        self._tab_stack.removeWidget(placeholder)
+        placeholder.deleteLater()
 
     def _on_unified_search(self):
         # called when any shared filter (search/status/mode/sort) changes
 
         self.update_beatmap_list()
-        if not (self._active_tab == "browse" or getattr(self, '_browse_fetched', False)):
+        if not (self._active_tab == "browse" or self._browse_fetched):
             return
 
         query = self.search_bar.text().strip()
         mode_fs = self.mode_filters
 
-        _STATUS_ID_TO_BROWSE = {'1': 'ranked', '3': 'qualified', '4': 'loved', '0': 'pending', '-1': 'wip', '-2': 'graveyard'}
         _status_fs = self.status_filters
         if len(_status_fs) == 0:
             browse_status, browse_statuses = '', set()
@@ -2819,40 +3245,20 @@ class MainWindow(QMainWindow):
             s = _STATUS_ID_TO_BROWSE.get(next(iter(_status_fs)), '')
             browse_status, browse_statuses = s, {s} if s else set()
         else:
-            browse_statuses = {_STATUS_ID_TO_BROWSE[k] for k in _status_fs if k in _STATUS_ID_TO_BROWSE}
+            browse_statuses = {_STATUS_ID_TO_BROWSE[k] for k in _status_fs & _STATUS_ID_TO_BROWSE.keys()}
             browse_status = '__multi__'
         api_mode = next(iter(mode_fs)) if len(mode_fs) == 1 else None
 
-        # map sort index to osu! api sort param
-
-        _BROWSE_SORT_MAP = {
-            0: 'ranked_desc',  # newest
-
-            1: 'ranked_asc',  # oldest
-
-            2: 'ranked_desc',  # status (no direct api equiv, use ranked desc)
-
-            3: 'title_asc',  # title
-
-            4: 'creator_asc',  # mapper
-
-            5: 'difficulty_desc',  # stars ↓
+        sort_index = self.sort_index
+        browse_sort = _BROWSE_SORT_MAP[sort_index] if 0 <= sort_index < len(_BROWSE_SORT_MAP) else 'ranked_desc'
 
-            6: 'difficulty_asc',  # stars ↑
 
-            7: 'ranked_desc',  # most diffs (no api equiv)
+        # status and mode sets are also filtered client side, changes that keep the
+        # api params never require a new fetch
 
-        }
-        browse_sort = _BROWSE_SORT_MAP.get(self.sort_index, 'ranked_desc')
-
-
-        # stars filter is client side, changes never require a new api fetch
-
-        _SENTINEL = object()
-        params_changed = (query != getattr(self, '_browse_api_query', _SENTINEL) or
-                          api_mode != getattr(self, '_browse_api_mode', _SENTINEL) or
-                          browse_status != getattr(self, '_browse_api_status', _SENTINEL) or
-                          browse_sort != getattr(self, '_browse_api_sort', _SENTINEL))
+        params_changed = ((query, api_mode, browse_status, browse_sort) !=
+                          (self._browse_api_query, self._browse_api_mode,
+                           self._browse_api_status, self._browse_api_sort))
         if params_changed:
             self._browse_api_query = query
             self._browse_api_mode = api_mode
@@ -2860,30 +3266,25 @@ class MainWindow(QMainWindow):
             self._browse_api_statuses = browse_statuses
             self._browse_api_sort = browse_sort
             self._browse_search_timer.start(400)
-        elif self._browse_results_by_status:
-            # stars / mode / status client side filter changed → instant rebuild from cache
+        elif self._browse_results_by_status and not self._browse_lookup_id:
+            # client side filter changed → hide cards in place when it only narrowed,
+            # otherwise instant rebuild from cache
 
+            filters = (frozenset(_status_fs), frozenset(mode_fs))
+            last_status, last_mode = self._browse_last_filters
+            if filters == self._browse_last_filters:
+                return
+            if _narrows(filters[0], last_status) and _narrows(filters[1], last_mode) and \
+                    self._browse_filter_in_place(*filters):
+                return
             self._browse_rebuild_from_cache()
 
     def _browse_reset_and_fetch(self):
         # clear cached results and start fresh fetch
 
-        # stop running workers
+        # requests still in flight are ignored via the generation counter
 
-        for w in list(getattr(self, '_browse_workers', {}).values()):
-            try:
-                w.result_ready.disconnect()
-                w.error_occurred.disconnect()
-            except Exception:
-                pass
-        self._browse_workers = {}
-        if self._browse_worker and self._browse_worker.isRunning():
-            try:
-                self._browse_worker.result_ready.disconnect()
-                self._browse_worker.error_occurred.disconnect()
-            except Exception:
-                pass
-        self._browse_worker = None
+        self._browse_pending = set()
         self._browse_results_by_status = {}
         self._browse_cursor = None
         self._browse_cursors = {}
@@ -2892,9 +3293,13 @@ class MainWindow(QMainWindow):
         self._browse_selected_ids.clear()
         self._browse_last_clicked_id = None
 
-        while self._browse_cards_layout.count() > 1:
-            item = self._browse_cards_layout.takeAt(0)
-            if item.widget(): item.widget().deleteLater()
+        with _batch_updates(self._browse_cards_widget):
+            while self._browse_cards_layout.count() > 1:
+                item = self._browse_cards_layout.takeAt(0)
+                if item.widget(): item.widget().deleteLater()
+        self._browse_card_by_id = {}
+        self._browse_merged = []
+        self._browse_realized = _BROWSE_CARD_BATCH
 
         if hasattr(self, '_browse_load_more_btn'):
             self._browse_load_more_btn.setText("Load more")
@@ -2904,16 +3309,17 @@ class MainWindow(QMainWindow):
         if query.isdigit():
             beatmap_id = query
         else:
-            m = re.search(r'/beatmapsets?/(\d+)', query)
+            m = _BMS_ID_RE.search(query)
             if m: beatmap_id = m.group(1)
 
+        self._browse_lookup_id = bool(beatmap_id)
         if beatmap_id:
             self._browse_status_lbl.setText(f"Looking up #{beatmap_id}...")
 
             self._browse_fetch_by_id(beatmap_id)
             return
 
-        statuses = getattr(self, '_browse_api_statuses', set())
+        statuses = self._browse_api_statuses
         if statuses and self._browse_api_status == '__multi__':
             self._browse_status_lbl.setText(f"Loading {len(statuses)} statuses...")
             for s in statuses:
@@ -2927,11 +3333,11 @@ class MainWindow(QMainWindow):
 
         if hasattr(self, '_browse_load_more_btn'):
             self._browse_load_more_btn.setText("Loading...")
-        statuses = getattr(self, '_browse_api_statuses', set())
+        statuses = self._browse_api_statuses
         if statuses and self._browse_api_status == '__multi__':
             for s in statuses:
                 cursor = self._browse_cursors.get(s)
-                if cursor and s not in self._browse_workers:
+                if cursor and s not in self._browse_pending:
                     self._browse_fetch_page(status_override=s, cursor=cursor)
         elif self._browse_cursor and not self._browse_loading:
             self._browse_fetch_page(cursor=self._browse_cursor)
@@ -2942,26 +3348,28 @@ class MainWindow(QMainWindow):
     def _browse_fetch_by_id(self, beatmap_id):
         # fetch a single beatmapset by id using get beatmap info, then show it
 
-        class _IdWorker(QThread):
-            done = pyqtSignal(dict)
-            fail = pyqtSignal(str)
-            def __init__(self, cid, csec, bid):
+        class _IdWorker(QRunnable):
+            def __init__(self, signals, cid, csec, bid):
                 super().__init__()
+                self.signals = signals
                 self.cid, self.csec, self.bid = cid, csec, bid
             def run(self):
                 info = get_beatmap_info(self.cid, self.csec, self.bid)
                 if info.get('ok'):
-                    self.done.emit(info)
+                    self.signals.result_ready.emit(info)
                 else:
-                    self.fail.emit(info.get('error', 'Not found'))
+                    self.signals.error_occurred.emit(info.get('error', 'Not found'))
 
-        worker = _IdWorker(self.config.get('client_id', ''),
+        signals = WorkerSignals(self)
+        worker = _IdWorker(signals,
+                           self.config.get('client_id', ''),
                            self.config.get('client_secret', ''),
                            beatmap_id)
 
         _gen_snap = self._browse_fetch_gen
 
         def on_done(info):
+            signals.deleteLater()
             if self._browse_fetch_gen != _gen_snap:
                 return  # stale result — a new search was started
 
@@ -2974,6 +3382,7 @@ class MainWindow(QMainWindow):
                 'title': info.get('title', ''),
                 'creator': info.get('creator', ''),
                 'status_id': info.get('status_id', '0'),
+                'diff_id': info.get('diff_id'),
                 'mode': info.get('mode', '0'),
                 'modes': info.get('modes', ['0']),
                 'diffs': info.get('diffs', []),
@@ -2982,34 +3391,34 @@ class MainWindow(QMainWindow):
                 'total_spinners': info.get('total_spinners', 0),
                 'cursor_string': None,
             }
-            # check not already shown
+            # ingest like a page result so it lands in the cache and _browse_merged,
+            # under a key the rebuild reads (multi status only reads the api_statuses set)
 
-            for i in range(self._browse_cards_layout.count()):
-                w = self._browse_cards_layout.itemAt(i).widget()
-                if w and getattr(w, '_bid', None) == bm['id']:
-                    self._browse_status_lbl.setText("1 result")
-                    return
-            existing_ids = {b['id'] for b in self.beatmaps}
-            self._browse_append_card(bm, existing_ids)
-            self._browse_status_lbl.setText("1 result")
+            key = self._browse_api_status
+            if key == '__multi__' and self._browse_api_statuses:
+                key = min(self._browse_api_statuses)
+            self._browse_on_results([bm], status_key=key)
 
         def on_fail(msg):
+            signals.deleteLater()
+            if self._browse_fetch_gen != _gen_snap:
+                return
             self._browse_loading = False
             self._browse_status_lbl.setText(f"Not found: {msg}")
 
         self._browse_loading = True
-        worker.done.connect(on_done)
-        worker.fail.connect(on_fail)
-        self._browse_worker = worker
-        worker.start()
+        signals.result_ready.connect(on_done)
+        signals.error_occurred.connect(on_fail)
+        self._browse_pool.start(worker)
 
     def _browse_fetch_page(self, cursor=None, status_override=None):
         # fire one api page request. status override used for parallel multi status fetches
 
         use_status = status_override if status_override is not None else self._browse_api_status
         if status_override is not None:
-            if status_override in self._browse_workers:
+            if status_override in self._browse_pending:
                 return
+            self._browse_pending.add(status_override)
         else:
             if self._browse_loading:
                 return
@@ -3017,59 +3426,92 @@ class MainWindow(QMainWindow):
 
         _status_snap = use_status
         _gen_snap = self._browse_fetch_gen
+        signals = None
+
+        def _finish():
+            # release the carrier and in flight marker, false when the result is stale
+
+            if signals is not None:
+                signals.deleteLater()
+            if self._browse_fetch_gen != _gen_snap:
+                return False
+            if status_override is not None:
+                self._browse_pending.discard(_status_snap)
+            else:
+                self._browse_loading = False
+            return True
+
+        def _deliver(beatmaps):
+            # clear in flight state first so button state is correct when rebuilding
+
+            if _finish():
+                self._browse_on_results(beatmaps, status_key=_status_snap)
+
+        # toggling filters back and forth re-requests the same pages, serve them from memory
+
+        key = (self._browse_api_query, self._browse_api_mode, use_status,
+               self._browse_api_sort, cursor or '')
+        cached = self._browse_page_cache.get(key)
+        if cached is not None and time.monotonic() - cached[0] < _BROWSE_PAGE_TTL:
+            self._browse_page_cache.move_to_end(key)
+            QTimer.singleShot(0, lambda: _deliver(cached[1]))
+            return
+
+        def on_results(beatmaps):
+            cache = self._browse_page_cache
+            cache[key] = (time.monotonic(), beatmaps)
+            cache.move_to_end(key)
+            while len(cache) > _BROWSE_PAGE_CACHE_SIZE:
+                cache.popitem(last=False)
+            _deliver(beatmaps)
+
+        def on_error(msg):
+            if _finish():
+                self._browse_on_error(msg)
 
-        worker = BrowseQualifiedWorkerThread(
+        signals = WorkerSignals(self)
+        worker = BrowseQualifiedWorker(
+            signals,
             self.config.get('client_id', ''),
             self.config.get('client_secret', ''),
             mode=self._browse_api_mode,
             cursor_string=cursor,
             status=use_status,
             query=self._browse_api_query,
-            sort=getattr(self, '_browse_api_sort', 'ranked_desc'),
+            sort=self._browse_api_sort,
         )
-
-        def on_results(beatmaps):
-            if self._browse_fetch_gen != _gen_snap: return
-            # remove worker first so button state is correct when rebuilding
-
-            if _status_snap in self._browse_workers:
-                del self._browse_workers[_status_snap]
-            else:
-                self._browse_loading = False
-            self._browse_on_results(beatmaps, status_key=_status_snap)
-
-        def on_error(msg):
-            if self._browse_fetch_gen != _gen_snap: return
-            if _status_snap in self._browse_workers:
-                del self._browse_workers[_status_snap]
-            else:
-                self._browse_loading = False
-            self._browse_on_error(msg)
-
-        worker.result_ready.connect(on_results)
-        worker.error_occurred.connect(on_error)
-        worker.start()
-
-        if status_override is not None:
-            self._browse_workers[status_override] = worker
-        else:
-            self._browse_worker = worker
+        signals.result_ready.connect(on_results)
+        signals.error_occurred.connect(on_error)
+        self._browse_pool.start(worker)
 
     def _browse_on_error(self, msg):
         self._browse_loading = False
         self._browse_status_lbl.setText(f"Error: {msg}")
 
     def _browse_on_scroll(self, value):
-        # auto load next page when scrolled near the bottom
+        # build more cards when within two viewports of the last one, then auto
+        # load the next page once every result has a card and we are near the bottom
 
         sb = self._browse_scroll.verticalScrollBar()
+        if value < sb.maximum() - 2 * sb.pageStep():
+            return
+        # valueChanged fires per pixel, check at most every 50 ms
+
+        now = time.monotonic()
+        if now - self._last_scroll_check < 0.05:
+            return
+        self._last_scroll_check = now
+        if self._browse_realized < len(self._browse_merged):
+            self._browse_realized += _BROWSE_CARD_BATCH
+            self._browse_rebuild_from_cache()
+            return
         if value < sb.maximum() - 300:
             return
-        statuses = getattr(self, '_browse_api_statuses', set())
+        statuses = self._browse_api_statuses
         if statuses and self._browse_api_status == '__multi__':
             for s in statuses:
                 cursor = self._browse_cursors.get(s)
-                if cursor and s not in self._browse_workers:
+                if cursor and s not in self._browse_pending:
                     self._browse_fetch_page(status_override=s, cursor=cursor)
         elif not self._browse_loading and self._browse_cursor:
             self._browse_fetch_page(cursor=self._browse_cursor)
@@ -3087,24 +3529,38 @@ class MainWindow(QMainWindow):
             self._browse_results_by_status[status_key] = []
         seen = {b['id'] for b in self._browse_results_by_status[status_key]}
         new_bms = [b for b in beatmaps if b['id'] not in seen]
+        for b in new_bms:
+            _browse_normalize(b)
         self._browse_results_by_status[status_key].extend(new_bms)
-        self._browse_rebuild_from_cache()
+
+        # parallel status pages land close together, rebuild once for all of them
+
+        if not self._browse_rebuild_pending:
+            self._browse_rebuild_pending = True
+            QTimer.singleShot(16, self._browse_flush_rebuild)
 
         # update load more button text
 
         if hasattr(self, '_browse_load_more_btn'):
-            still_loading = bool(getattr(self, '_browse_workers', {})) or self._browse_loading
+            still_loading = bool(self._browse_pending) or self._browse_loading
             if still_loading:
                 self._browse_load_more_btn.setText("Loading...")
             else:
                 self._browse_load_more_btn.setText("Load more")
 
+    def _browse_flush_rebuild(self):
+        self._browse_rebuild_pending = False
+        self._browse_rebuild_from_cache()
 
     def _browse_rebuild_from_cache(self):
         # rebuild browse cards from cache applying filters. interleaves multi status results
 
-        current_key = getattr(self, '_browse_api_status', '')
-        api_statuses = getattr(self, '_browse_api_statuses', set())
+        if not self._browse_scroll.isVisible():
+            self._browse_dirty = True
+            return
+        self._browse_dirty = False
+        current_key = self._browse_api_status
+        api_statuses = self._browse_api_statuses
         merged = []
         seen_ids = set()
 
@@ -3112,14 +3568,11 @@ class MainWindow(QMainWindow):
             # round robin interleave so statuses appear mixed
 
             buckets = [self._browse_results_by_status.get(s, []) for s in api_statuses]
-            max_len = max((len(b) for b in buckets), default=0)
-            for i in range(max_len):
-                for bucket in buckets:
-                    if i < len(bucket):
-                        bm = bucket[i]
-                        if bm['id'] not in seen_ids:
-                            seen_ids.add(bm['id'])
-                            merged.append(bm)
+            for bm in chain.from_iterable(zip_longest(*buckets)):
+                if bm is None or bm['id'] in seen_ids:
+                    continue
+                seen_ids.add(bm['id'])
+                merged.append(bm)
         elif current_key in self._browse_results_by_status:
             for bm in self._browse_results_by_status[current_key]:
                 if bm['id'] not in seen_ids:
@@ -3132,41 +3585,79 @@ class MainWindow(QMainWindow):
                         seen_ids.add(bm['id'])
                         merged.append(bm)
 
-        # client side status filter
-
-        _status_fs = self.status_filters
-        if _status_fs:
-            merged = [b for b in merged if str(b.get('status_id', '')) in _status_fs]
-
-        # client side mode filter, check primary mode and all modes list
+        # client side status and mode filters, mode checks primary mode and all modes list.
+        # an id lookup always shows what the api found
 
-        _mode_fs = self.mode_filters if hasattr(self, 'mode_filters') else set()
-        if _mode_fs:
-            def _mode_matches(b):
-                if str(b.get('mode', '')) in _mode_fs:
-                    return True
-                return any(str(m) in _mode_fs for m in b.get('modes', []))
-            merged = [b for b in merged if _mode_matches(b)]
+        status_fs = frozenset(self.status_filters)
+        mode_fs = frozenset(self.mode_filters)
+        self._browse_last_filters = (status_fs, mode_fs)
+        if (status_fs or mode_fs) and not self._browse_lookup_id:
+            merged = [b for b in merged if _browse_passes_filters(b, status_fs, mode_fs)]
 
 
         # note: sorting is done server side via api sort param for browse
 
 
-        # clear and rebuild cards
-
-        while self._browse_cards_layout.count() > 1:
-            item = self._browse_cards_layout.takeAt(0)
-            if item.widget():
-                item.widget().deleteLater()
-        self._browse_selected_ids.clear()
+        # only the first _browse_realized results get a card, the rest are
+        # built on demand as the list scrolls towards them
+
+        self._browse_merged = merged
+        realized = merged[:self._browse_realized]
+
+        # diff against the cards already shown: drop cards that left the result
+        # set (or whose tracked state changed), reuse the rest in place and only
+        # build widgets for ids that are new
+
+        existing_ids = self._tracked_ids
+        wanted_ids = {bm['id'] for bm in realized}
+        layout = self._browse_cards_layout
+        old_cards = self._browse_card_by_id
+        self._browse_card_by_id = {}
+        with _batch_updates(self._browse_cards_widget, self._browse_scroll.verticalScrollBar()):
+            for bid, card in old_cards.items():
+                if bid not in wanted_ids or card._already != (bid in existing_ids):
+                    layout.removeWidget(card)
+                    card.deleteLater()
+            for i, bm in enumerate(realized):
+                bid = bm['id']
+                card = old_cards.get(bid)
+                if card is None or card._already != (bid in existing_ids):
+                    card = self._browse_append_card(bm, existing_ids)
+                else:
+                    self._browse_card_by_id[bid] = card
+                    if card.isHidden():
+                        card.show()
+                if layout.indexOf(card) != i:
+                    layout.insertWidget(i, card)
+        self._browse_after_filter()
+
+    def _browse_filter_in_place(self, status_fs, mode_fs):
+        # narrowing a client side filter keeps the survivors in the same order, so
+        # hide the cards that dropped out instead of rebuilding. false when a card
+        # would be missing from the realized window and a rebuild is needed
+
+        merged = [b for b in self._browse_merged if _browse_passes_filters(b, status_fs, mode_fs)]
+        cards = self._browse_card_by_id
+        keep = {bm['id'] for bm in merged[:self._browse_realized]}
+        if not keep <= cards.keys():
+            return False
+        with _batch_updates(self._browse_cards_widget):
+            for bid, card in cards.items():
+                card.setVisible(bid in keep)
+        self._browse_merged = merged
+        self._browse_last_filters = (status_fs, mode_fs)
+        self._browse_after_filter()
+        return True
+
+    def _browse_after_filter(self):
+        # drop selections that were filtered out and refresh the result count
+
+        selectable = {bm['id'] for bm in self._browse_merged} - self._tracked_ids
+        self._browse_selected_ids &= selectable
         if hasattr(self, '_browse_add_sel_btn'):
-            self._browse_add_sel_btn.setEnabled(False)
-
-        existing_ids = {b['id'] for b in self.beatmaps}
-        for bm in merged:
-            self._browse_append_card(bm, existing_ids)
+            self._browse_add_sel_btn.setEnabled(bool(self._browse_selected_ids))
 
-        shown = len(merged)
+        shown = len(self._browse_merged)
         suffix = " — scroll for more" if self._browse_cursor else ""
         self._browse_status_lbl.setText(f"{shown} results{suffix}")
 
@@ -3176,7 +3667,7 @@ class MainWindow(QMainWindow):
 
         bid = bm['id']
         already = bid in existing_ids
-        status_info = BEATMAP_STATUS.get(str(bm.get('status_id', '0')), BEATMAP_STATUS['0'])
+        status_info = _STATUS_BY_ANY.get(bm.get('status_id', 0), BEATMAP_STATUS['0'])
         mode_info = MODE_INFO.get(bm.get('mode'), MODE_INFO[None])
         diffs = bm.get('diffs', [])
         diff_count = bm.get('diff_count', len(diffs))
@@ -3188,17 +3679,14 @@ class MainWindow(QMainWindow):
         diff_section_h = (5 + len(diffs) * DIFF_ROW_H) if diffs else 0
         card_height = 78 + diff_section_h
 
-        card = QFrame()
+        card = _BrowseCard(self, bm, already)
+        card.setObjectName("browseCard")
         card.setFixedHeight(card_height)
-        card.setStyleSheet(_BROWSE_STYLE_DONE if already else _BROWSE_STYLE_BASE)
+        if already:
+            card.setProperty('state', 'done')
+        else:
+            card.setProperty('state', 'selected' if bid in self._browse_selected_ids else 'base')
         card.setCursor(Qt.CursorShape.ArrowCursor if already else Qt.CursorShape.PointingHandCursor)
-        card._bid = bid
-        card._base_style = _BROWSE_STYLE_BASE
-        card._hover_style = _BROWSE_STYLE_HOVER
-        card._sel_style = _BROWSE_STYLE_SELECTED
-        card._done_style = _BROWSE_STYLE_DONE
-        card._bm_data = bm
-        card._already = already
 
         root = QVBoxLayout(card)
         root.setContentsMargins(8, 8, 10, 8)
@@ -3210,21 +3698,19 @@ class MainWindow(QMainWindow):
 
         cover = QLabel()
         cover.setFixedSize(96, 62)
-        cover.setStyleSheet(f"background: {COLOR_BG}; border-radius: 6px; border: none;")
+        cover.setStyleSheet(_BROWSE_COVER_CSS)
         cover.setAlignment(Qt.AlignmentFlag.AlignCenter)
         gen_snap = self._browse_fetch_gen
-        if bid in _cover_cache:
-            self._apply_browse_cover(cover, _cover_cache[bid])
+        cached = _cover_cache_find(bid)
+        if cached is not None or bid in _cover_missing:
+            self._apply_browse_cover(cover, cached, bid)
         else:
             cover.setText("...")
             def _bcb(b, data, lbl=cover, gen=gen_snap, win=self):
                 try:
+                    px = _cover_cache_store(b, data)
                     if gen != win._browse_fetch_gen: return
-                    px = QPixmap()
-                    if data: px.loadFromData(data)
-                    else: px = None
-                    _cover_cache[b] = px
-                    win._apply_browse_cover(lbl, px)
+                    win._apply_browse_cover(lbl, px, b)
                 except Exception:
                     pass
             _cover_pool.submit(bid, 'list', _bcb)
@@ -3234,9 +3720,8 @@ class MainWindow(QMainWindow):
         info.setSpacing(3)
         info.setContentsMargins(0, 0, 0, 0)
 
-        title_col = COLOR_TEXT_DIM if already else COLOR_TEXT
         title_label = QLabel(f"{bm.get('artist','')} — {bm.get('title','')}")
-        title_label.setStyleSheet(f"color: {title_col}; font-size: 12px; font-weight: bold; background: transparent; border: none;")
+        title_label.setStyleSheet(_TITLE_CSS_DIM if already else _TITLE_CSS)
         title_label.setWordWrap(False)
         info.addWidget(title_label)
 
@@ -3247,10 +3732,10 @@ class MainWindow(QMainWindow):
         tags.addWidget(_tag_label(mode_info['label'], mode_info['color']))
         if already:
             already_label = QLabel("tracked")
-            already_label.setStyleSheet(f"color: {COLOR_ACCENT}; font-size: 10px; font-weight: bold; background: transparent; border: none;")
+            already_label.setStyleSheet(_ACCENT_TAG_CSS)
             tags.addWidget(already_label)
         creator_label = QLabel(f"by {bm.get('creator','')}")
-        creator_label.setStyleSheet(f"color: {COLOR_TEXT_DIM}; font-size: 11px; background: transparent; border: none;")
+        creator_label.setStyleSheet(_DIM_TEXT_CSS)
         tags.addWidget(creator_label)
         tags.addStretch()
         info.addLayout(tags)
@@ -3263,7 +3748,7 @@ class MainWindow(QMainWindow):
         if total_sp:  stats.addWidget(_stat_label(f"◎ {total_sp}", "Total spinners"))
         id_label = QLabel(f"#{bid}")
 
-        id_label.setStyleSheet(f"color: {COLOR_TEXT_DIM}50; font-size: 10px; font-family: Consolas; background: transparent; border: none;")
+        id_label.setStyleSheet(_CARD_ID_CSS)
         stats.addWidget(id_label)
         stats.addStretch()
         info.addLayout(stats)
@@ -3273,175 +3758,120 @@ class MainWindow(QMainWindow):
 
         if not already:
             hint = QLabel("doubleclick / Enter")
-            hint.setStyleSheet(f"color: {COLOR_ACCENT}; font-size: 10px; font-weight: bold; background: transparent; border: none;")
+            hint.setStyleSheet(_ACCENT_TAG_CSS)
             hint.setVisible(False)
             card._hint_lbl = hint
             top.addWidget(hint, 0, Qt.AlignmentFlag.AlignVCenter)
-        else:
-            card._hint_lbl = None
 
         root.addLayout(top)
 
         if diffs:
             sep = QFrame()
             sep.setFrameShape(QFrame.Shape.HLine)
-            sep.setStyleSheet(f"background: {COLOR_ACCENT}30; border: none;")
+            sep.setStyleSheet(_CARD_SEP_CSS)
             sep.setFixedHeight(1)
             root.addWidget(sep)
             diffs_indent = QHBoxLayout()
             diffs_indent.setContentsMargins(106, 2, 0, 0)
-            diffs_col = QVBoxLayout()
-            diffs_col.setSpacing(2)
-            diffs_col.setContentsMargins(0, 0, 0, 0)
-            for diff in diffs:
-                stars = diff.get('stars', 0)
-                star_color = _star_color(stars)
-                diff_row = QHBoxLayout()
-                diff_row.setSpacing(8)
-                diff_row.setContentsMargins(0, 0, 0, 0)
-
-                star_label = QLabel(f"★ {stars:.2f}")
-                star_label.setStyleSheet(f"color: {star_color}; font-size: 11px; font-weight: bold; background: transparent; border: none; min-width: 52px;")
-                diff_row.addWidget(star_label)
-
-                name_label = QLabel(diff.get('name', ''))
-                name_label.setStyleSheet(f"color: {COLOR_TEXT_DIM}; font-size: 11px; background: transparent; border: none;")
-                name_label.setWordWrap(False)
-                diff_row.addWidget(name_label, 1)
-
-                diff_length = diff.get('length', 0)
-                diff_mins, diff_secs = divmod(diff_length, 60)
-                time_label = QLabel(f"⏱ {diff_mins}:{diff_secs:02d}")
-                time_label.setStyleSheet(f"color: {COLOR_TEXT_DIM}; font-size: 11px; background: transparent; border: none;")
-                diff_row.addWidget(time_label)
-
-                if diff.get('spinners'):
-                    spinner_label = QLabel(f"◎ {diff['spinners']}")
-                    spinner_label.setStyleSheet(f"color: {COLOR_TEXT_DIM}; font-size: 11px; background: transparent; border: none;")
-                    diff_row.addWidget(spinner_label)
-
-                diffs_col.addLayout(diff_row)
-            diffs_indent.addLayout(diffs_col)
+            diffs_indent.addWidget(_diffs_label(diffs))
             root.addLayout(diffs_indent)
 
-        # click = select; double click or enter = add; hover = highlight
+        self._browse_cards_layout.insertWidget(self._browse_cards_layout.count() - 1, card)
+        self._browse_card_by_id[bid] = card
+        return card
 
-        if not already:
-            def on_click(ev, b=bid, bm_data=bm, c=card):
-                if ev.button() != Qt.MouseButton.LeftButton: return
-                modifiers = ev.modifiers()
-                shift = bool(modifiers & Qt.KeyboardModifier.ShiftModifier)
-                ctrl = bool(modifiers & Qt.KeyboardModifier.ControlModifier)
-                self._browse_toggle_selection(b, c, shift=shift, ctrl=ctrl)
-
-            def on_dblclick(ev, b=bid, bm_data=bm, c=card):
-                if ev.button() != Qt.MouseButton.LeftButton: return
-                if not c._already:
-                    self._do_add_browse_card(b, bm_data, c)
-
-            def on_enter(ev, c=card):
-                if not c._already and bid not in self._browse_selected_ids:
-                    c.setStyleSheet(c._hover_style)
-                    if c._hint_lbl: c._hint_lbl.setVisible(True)
-                super(QFrame, c).enterEvent(ev)
-
-            def on_leave(ev, c=card):
-                if not c._already:
-                    c.setStyleSheet(c._sel_style if bid in self._browse_selected_ids else c._base_style)
-                    if c._hint_lbl: c._hint_lbl.setVisible(False)
-                super(QFrame, c).leaveEvent(ev)
-
-            card.mousePressEvent = on_click
-            card.mouseDoubleClickEvent = on_dblclick
-            card.enterEvent = on_enter
-            card.leaveEvent = on_leave
-
-        # context menu
-
-        card.setContextMenuPolicy(Qt.ContextMenuPolicy.CustomContextMenu)
-        def _ctx(pos, b=bid, bm_data=bm, c=card):
-            menu = QMenu(c)
-            menu.setStyleSheet(self._menu_style())
+    def _show_browse_context_menu(self, card, global_pos):
+        # right click menu for a browse card, built only when requested
 
-            # 🌐 navigate
+        b, bm_data = card._bid, card._bm_data
+        menu = QMenu(card)
+        menu.setStyleSheet(self._menu_style())
 
-            open_a = menu.addAction("🌐  Open on osu.ppy.sh")
-            menu.addSeparator()
+        # 🌐 navigate
 
-            # ➕ tracking
+        open_a = menu.addAction("🌐  Open on osu.ppy.sh")
+        menu.addSeparator()
 
-            add_a, add_sel_a = None, None
-            if not getattr(c, '_already', True):
-                add_a = menu.addAction("➕  Add to tracking  (Enter / dblclick)")
-                n_sel = len(self._browse_selected_ids)
-                if n_sel > 1 and b in self._browse_selected_ids:
-                    add_sel_a = menu.addAction(f"➕  Add selected ({n_sel})  (Ctrl+Enter)")
-                menu.addSeparator()
+        # ➕ tracking
 
-            # 📋 copy
-
-            copy_menu = menu.addMenu("📋  Copy…")
-            copy_menu.setStyleSheet(self._menu_style())
-            copy_id_a     = copy_menu.addAction("Copy ID")
-            copy_link_a   = copy_menu.addAction("Copy link")
-            copy_title_a  = copy_menu.addAction("Copy title")
-            copy_artist_a = copy_menu.addAction("Copy artist")
+        add_a, add_sel_a = None, None
+        if not card._already:
+            add_a = menu.addAction("➕  Add to tracking  (Enter / dblclick)")
+            n_sel = len(self._browse_selected_ids)
+            if n_sel > 1 and b in self._browse_selected_ids:
+                add_sel_a = menu.addAction(f"➕  Add selected ({n_sel})  (Ctrl+Enter)")
             menu.addSeparator()
 
-            # ✓ selection
+        # 📋 copy
+
+        copy_menu = menu.addMenu("📋  Copy…")
+        copy_menu.setStyleSheet(self._menu_style())
+        copy_id_a     = copy_menu.addAction("Copy ID")
+        copy_link_a   = copy_menu.addAction("Copy link")
+        copy_title_a  = copy_menu.addAction("Copy title")
+        copy_artist_a = copy_menu.addAction("Copy artist")
+        menu.addSeparator()
 
-            sel_all_a   = menu.addAction("✓  Select all  (Ctrl+A)")
-            desel_all_a = menu.addAction("✗  Deselect all  (Ctrl+Z)")
+        # ✓ selection
 
-            action = menu.exec(c.mapToGlobal(pos))
-            if action is None:
-                return
-            if action == open_a:
-                webbrowser.open(f'https://osu.ppy.sh/beatmapsets/{b}')
-            elif add_a and action == add_a:
-                self._do_add_browse_card(b, bm_data, c)
-            elif add_sel_a and action == add_sel_a:
-                self._browse_add_selected_to_tracking()
-            elif action == copy_id_a:
-                QApplication.clipboard().setText(b)
-                self.status_label.setText(f"Copied ID: {b}")
-            elif action == copy_link_a:
-                QApplication.clipboard().setText(f'https://osu.ppy.sh/beatmapsets/{b}')
-                self.status_label.setText("Copied link")
-            elif action == copy_title_a:
-                QApplication.clipboard().setText(f"{bm_data.get('artist','')} - {bm_data.get('title','')}")
-                self.status_label.setText("Copied title")
-            elif action == copy_artist_a:
-                QApplication.clipboard().setText(bm_data.get('artist', ''))
-                self.status_label.setText("Copied artist")
-            elif action == sel_all_a:
-                self._browse_select_all()
-            elif action == desel_all_a:
-                self._browse_deselect_all()
-        card.customContextMenuRequested.connect(_ctx)
+        sel_all_a   = menu.addAction("✓  Select all  (Ctrl+A)")
+        desel_all_a = menu.addAction("✗  Deselect all  (Ctrl+Z)")
 
-        self._browse_cards_layout.insertWidget(self._browse_cards_layout.count() - 1, card)
+        action = menu.exec(global_pos)
+        if action is None:
+            return
+        if action == open_a:
+            webbrowser.open(f'https://osu.ppy.sh/beatmapsets/{b}')
+        elif add_a and action == add_a:
+            self._do_add_browse_card(b, bm_data, card)
+        elif add_sel_a and action == add_sel_a:
+            self._browse_add_selected_to_tracking()
+        elif action == copy_id_a:
+            QApplication.clipboard().setText(b)
+            self.status_label.setText(f"Copied ID: {b}")
+        elif action == copy_link_a:
+            QApplication.clipboard().setText(f'https://osu.ppy.sh/beatmapsets/{b}')
+            self.status_label.setText("Copied link")
+        elif action == copy_title_a:
+            QApplication.clipboard().setText(f"{bm_data.get('artist','')} - {bm_data.get('title','')}")
+            self.status_label.setText("Copied title")
+        elif action == copy_artist_a:
+            QApplication.clipboard().setText(bm_data.get('artist', ''))
+            self.status_label.setText("Copied artist")
+        elif action == sel_all_a:
+            self._browse_select_all()
+        elif action == desel_all_a:
+            self._browse_deselect_all()
+
+    def _browse_card_hover(self, card, hovering):
+        # hover highlight and add hint, only for cards that can still be added
 
-    def _apply_browse_cover(self, label, pixmap):
+        if card._already:
+            return
+        if hovering:
+            if card._bid not in self._browse_selected_ids:
+                _set_card_state(card, 'hover')
+                if card._hint_lbl: card._hint_lbl.setVisible(True)
+        else:
+            _set_card_state(card, 'selected' if card._bid in self._browse_selected_ids else 'base')
+            if card._hint_lbl: card._hint_lbl.setVisible(False)
+
+    def _apply_browse_cover(self, label, pixmap, bid):
         if not pixmap:
             label.setText("N/A")
             return
-        label.setPixmap(_scale_cover(pixmap, 96, 62))
+        label.setPixmap(_scaled_cover(bid, pixmap, 96, 62))
 
     def _browse_toggle_selection(self, bid, card, shift=False, ctrl=False):
         # toggle selection of a browse card with shift/ctrl support
 
         # already tracked cards cannot be selected
 
-        if getattr(card, '_already', False):
+        if card._already:
             return
-        # build ordered list of visible non tracked card bids
+        # ordered non tracked result bids, built or not yet
 
-        visible_bids = []
-        for i in range(self._browse_cards_layout.count()):
-            w = self._browse_cards_layout.itemAt(i).widget()
-            if w and hasattr(w, '_bid') and not getattr(w, '_already', True):
-                visible_bids.append(w._bid)
+        visible_bids = [bm['id'] for bm in self._browse_merged if bm['id'] not in self._tracked_ids]
 
         if shift and self._browse_last_clicked_id and self._browse_last_clicked_id in visible_bids and bid in visible_bids:
             i1 = visible_bids.index(self._browse_last_clicked_id)
@@ -3472,13 +3902,9 @@ class MainWindow(QMainWindow):
     def _browse_refresh_selection_styles(self):
         # update visual selection state of all browse cards
 
-        for i in range(self._browse_cards_layout.count()):
-            w = self._browse_cards_layout.itemAt(i).widget()
-            if w and hasattr(w, '_bid') and not getattr(w, '_already', True):
-                if w._bid in self._browse_selected_ids:
-                    w.setStyleSheet(w._sel_style)
-                else:
-                    w.setStyleSheet(w._base_style)
+        for w in self._browse_card_by_id.values():
+            if not w._already:
+                _set_card_state(w, 'selected' if w._bid in self._browse_selected_ids else 'base')
         # enable/disable add button
 
         if hasattr(self, '_browse_add_sel_btn'):
@@ -3489,7 +3915,7 @@ class MainWindow(QMainWindow):
 
         self._add_beatmaps_from_browse([bm_data])
         card._already = True
-        card.setStyleSheet(card._done_style)
+        _set_card_state(card, 'done')
         card.setCursor(Qt.CursorShape.ArrowCursor)
         if card._hint_lbl: card._hint_lbl.setVisible(False)
         self._browse_selected_ids.discard(bid)
@@ -3498,33 +3924,29 @@ class MainWindow(QMainWindow):
         self._browse_refresh_selection_styles()
 
     def _browse_add_selected_to_tracking(self):
-        # add all currently selected browse cards to tracking
-
-        to_add = []
-        cards_to_mark = []
-        for i in range(self._browse_cards_layout.count()):
-            w = self._browse_cards_layout.itemAt(i).widget()
-            if w and hasattr(w, '_bid') and w._bid in self._browse_selected_ids and not getattr(w, '_already', True):
-                to_add.append(w._bm_data)
-                cards_to_mark.append(w)
+        # add all currently selected browse results to tracking, built or not
+
+        to_add = [bm for bm in self._browse_merged
+                  if bm['id'] in self._browse_selected_ids and bm['id'] not in self._tracked_ids]
+        cards_to_mark = [self._browse_card_by_id[bm['id']] for bm in to_add
+                         if bm['id'] in self._browse_card_by_id]
         if to_add:
             self._add_beatmaps_from_browse(to_add)
-            for w in cards_to_mark:
-                w._already = True
-                w.setStyleSheet(w._done_style)
-                w.setCursor(Qt.CursorShape.ArrowCursor)
-                if hasattr(w, '_hint_lbl') and w._hint_lbl:
-                    w._hint_lbl.setVisible(False)
+            with _batch_updates(self._browse_cards_widget):
+                for w in cards_to_mark:
+                    w._already = True
+                    _set_card_state(w, 'done')
+                    w.setCursor(Qt.CursorShape.ArrowCursor)
+                    if w._hint_lbl:
+                        w._hint_lbl.setVisible(False)
             self._browse_selected_ids.clear()
             self.status_label.setText(f"Added {len(to_add)} beatmap(s) to tracking")
 
     def _browse_select_all(self):
-        # select all non tracked browse cards
+        # select all non tracked browse results, including ones without a card yet
 
-        for i in range(self._browse_cards_layout.count()):
-            w = self._browse_cards_layout.itemAt(i).widget()
-            if w and hasattr(w, '_bid') and not getattr(w, '_already', True):
-                self._browse_selected_ids.add(w._bid)
+        self._browse_selected_ids.update(bm['id'] for bm in self._browse_merged
+                                         if bm['id'] not in self._tracked_ids)
         self._browse_refresh_selection_styles()
         n = len(self._browse_selected_ids)
         if n:
@@ -3605,12 +4027,7 @@ class MainWindow(QMainWindow):
         # status badge, main focus, takes most space
 
         self.detail_status = QLabel("---")
-        self.detail_status.setStyleSheet(f"""
-            color: {COLOR_ACCENT};
-            font-size: 48px;
-            font-weight: bold;
-            padding: 20px;
-        """)
+        self.detail_status.setStyleSheet(_DETAIL_STATUS_STYLE)
         self.detail_status.setAlignment(Qt.AlignmentFlag.AlignCenter)
         self.detail_status.setSizePolicy(
             QSizePolicy.Policy.Expanding,
@@ -3624,14 +4041,7 @@ class MainWindow(QMainWindow):
         # clickable id label
 
         self.detail_id = QLabel("ID: ---")
-        self.detail_id.setStyleSheet(f"""
-            color: {COLOR_TEXT_DIM};
-            font-size: 12px;
-            font-family: 'Consolas', monospace;
-            padding: 8px;
-            background-color: {COLOR_BG};
-            border-radius: 6px;
-        """)
+        self.detail_id.setStyleSheet(_DETAIL_ID_STYLE)
         self.detail_id.setAlignment(Qt.AlignmentFlag.AlignCenter)
         self.detail_id.setCursor(Qt.CursorShape.PointingHandCursor)
         self.detail_id.setToolTip("Click to copy ID")
@@ -3726,6 +4136,7 @@ class MainWindow(QMainWindow):
         # if browse tab is active, refresh browse results
 
         if getattr(self, '_active_tab', 'tracked') == 'browse':
+            self._browse_page_cache.clear()
             self._browse_reset_and_fetch()
             self.status_label.setText("Browse refreshed")
             return
@@ -3737,7 +4148,7 @@ class MainWindow(QMainWindow):
             return
         self.status_label.setText("Refreshing all beatmaps...")
         self._refresh_worker = RefreshAllWorkerThread(
-            [dict(b) for b in self.beatmaps],
+            [(i, b['id']) for i, b in enumerate(self.beatmaps)],
             self.config['client_id'],
             self.config['client_secret']
         )
@@ -3747,13 +4158,20 @@ class MainWindow(QMainWindow):
     def _on_refresh_all_results(self, results):
         try:
             updated = 0
+            now = time.time()
             for r in results:
                 try:
                     i = r['index']
                     info = r['info']
+                    # skip rows that were deleted or moved while the refresh ran
+
+                    if i >= len(self.beatmaps) or self.beatmaps[i]['id'] != r['id']:
+                        continue
                     if info['ok']:
                         self.beatmaps[i]['status_id'] = info['status_id']
-                        self.beatmaps[i]['last_checked'] = time.time()
+                        self.beatmaps[i]['last_checked'] = now
+                        if info.get('diff_id'):
+                            self.beatmaps[i]['diff_id'] = info['diff_id']
                         if info.get('diffs'):
                             self.beatmaps[i]['diffs'] = info['diffs']
                             self.beatmaps[i]['diff_count'] = info.get('diff_count', len(info['diffs']))
@@ -3761,8 +4179,8 @@ class MainWindow(QMainWindow):
                 except Exception:
                     pass
             self.config['beatmaps'] = self.beatmaps
-            save_config(self.config)
-            self.update_beatmap_list(full_rebuild=True)
+            self._save_config_later()
+            self._rebuild_tracked_later()
             if self.selected_index is not None and self.selected_index < len(self.beatmaps):
                 self._show_beatmap_details(self.selected_index)
             self.status_label.setText(f"Refreshed {updated} of {len(self.beatmaps)} beatmap(s)")
@@ -3777,31 +4195,14 @@ class MainWindow(QMainWindow):
             beatmap = self.beatmaps[self.selected_index]
             QApplication.clipboard().setText(beatmap['id'])
             self.status_label.setText(f"Copied ID: {beatmap['id']}")
-            # visual feedback
-
-            self.detail_id.setStyleSheet(f"""
-                color: {COLOR_ACCENT};
-                font-size: 12px;
-                font-family: 'Consolas', monospace;
-                margin-top: 20px;
-                padding: 8px;
-                background-color: {COLOR_ACCENT}20;
-                border-radius: 6px;
-                border: 2px solid {COLOR_ACCENT};
-            """)
-            # reset style after a short delay
+            # visual feedback, flips the label to its [state="copied"] rule
 
-            QTimer.singleShot(500, lambda: self.detail_id.setStyleSheet(f"""
-                color: {COLOR_TEXT_DIM};
-                font-size: 12px;
-                font-family: 'Consolas', monospace;
-                margin-top: 20px;
-                padding: 8px;
-                background-color: {COLOR_BG};
-                border-radius: 6px;
-            """))
+            _set_card_state(self.detail_id, 'copied')
+            QTimer.singleShot(500, Qt.TimerType.CoarseTimer, lambda: _set_card_state(self.detail_id, 'base'))
 
-    def update_beatmap_list(self, full_rebuild=False):
+    def update_beatmap_list(self, full_rebuild=False, changed_indices=None):
+        # changed_indices: beatmaps whose data changed. when the shown cards stay the
+        # same only those are refreshed, None refreshes every shown card
         try:
             query = self.search_bar.text().lower()
             status_fs = self.status_filters
@@ -3810,23 +4211,36 @@ class MainWindow(QMainWindow):
 
             # update counter
 
-            monitored = sum(1 for b in self.beatmaps if b.get('monitored', False))
-            self.counter_label.setText(f"{monitored} / {len(self.beatmaps)} monitored")
+            self.counter_label.setText(f"{self._monitored_count} / {len(self.beatmaps)} monitored")
+
+            # nothing to lay out while browse is showing, rebuild when the list is shown again
+
+            if not self._tracked_scroll.isVisible():
+                self._list_dirty = True
+                return
+            self._list_dirty = False
 
             # build sorted+filtered list of (original index, beatmap)
 
             filtered = []
-            _url_match = re.search(r'/beatmapsets?/(\d+)', query)
+            _url_match = _BMS_ID_RE.search(query)
             _id_from_url = _url_match.group(1) if _url_match else None
+            words = query.split()
+            haystacks = self._haystacks
+            # several words: one anchored lookahead per word, so a single match() call
+            # checks them all. a lone word keeps the plain substring test
+
+            all_words = None
+            if len(words) > 1:
+                all_words = re.compile(''.join(f'(?=.*{re.escape(w)})' for w in words), re.DOTALL).match
 
 
             for i, bm in enumerate(self.beatmaps):
-                if status_fs and str(bm.get('status_id', '')) not in status_fs:
+                if status_fs and bm['status_id'] not in status_fs:
                     continue
                 if mode_fs and str(bm.get('mode', '0')) not in mode_fs:
                     continue
                 if query:
-                    haystack = f"{bm.get('artist','')} {bm.get('title','')} {bm.get('creator','')} {bm.get('id','')}".lower()
                     # id/url match: if query is a full url, match by extracted id only
 
                     if _id_from_url and len(query) > 6:
@@ -3835,110 +4249,142 @@ class MainWindow(QMainWindow):
                     else:
                         # multi word and search: all words must appear somewhere
 
-                        words = query.split()
-                        if not all(w in haystack for w in words):
+                        bid = bm.get('id', '')
+                        haystack = haystacks.get(bid)
+                        if haystack is None:
+                            haystack = haystacks[bid] = f"{bm.get('artist','')} {bm.get('title','')} {bm.get('creator','')} {bid}".lower()
+                        if all_words is not None:
+                            if not all_words(haystack):
+                                continue
+                        elif words and words[0] not in haystack:
                             continue
                 filtered.append((i, bm))
 
-            STATUS_ORD = {'1': 0, '3': 1, '4': 2, '0': 3, '-1': 4, '-2': 5}
-            if sort_option == 0:
-                filtered.sort(key=lambda x: x[1].get('added_at', 0), reverse=True)
-            elif sort_option == 1:
-                filtered.sort(key=lambda x: x[1].get('added_at', 0))
-            elif sort_option == 2:
-                filtered.sort(key=lambda x: STATUS_ORD.get(str(x[1].get('status_id', '0')), 99))
-            elif sort_option == 3:
-                filtered.sort(key=lambda x: f"{x[1].get('artist','')} - {x[1].get('title','')}".lower())
-            elif sort_option == 4:
-                filtered.sort(key=lambda x: x[1].get('creator', '').lower())
-            elif sort_option == 5:  # stars ↓
+            if 0 <= sort_option < len(_TRACKED_SORTS):
+                sort_key, descending = _TRACKED_SORTS[sort_option]
+                filtered.sort(key=lambda x: sort_key(x[1]), reverse=descending)
 
-                filtered.sort(key=lambda x: -(x[1].get('diffs', [{}])[0].get('stars', 0) if x[1].get('diffs') else 0))
-            elif sort_option == 6:  # stars ↑
+            # a new search, filter or sort starts over with one batch of cards
 
-                filtered.sort(key=lambda x: (x[1].get('diffs', [{}])[0].get('stars', 0) if x[1].get('diffs') else 0))
-            elif sort_option == 7:  # most diffs
-
-                filtered.sort(key=lambda x: -x[1].get('diff_count', 0))
+            filter_key = (query, frozenset(status_fs), frozenset(mode_fs), sort_option)
+            if filter_key != self._tracked_filter_key:
+                self._tracked_filter_key = filter_key
+                self._tracked_realized = _TRACKED_CARD_BATCH
+                self._tracked_scroll.verticalScrollBar().setValue(0)
+            self._tracked_filtered = filtered
+            shown = filtered[:self._tracked_realized]
 
             # check if we need a full rebuild (card set changed)
 
-            current_ids = []
-            for i in range(self.beatmap_layout.count()):
-                w = self.beatmap_layout.itemAt(i).widget()
-                if isinstance(w, BeatmapCard):
-                    current_ids.append(w.index)
-
-            needed_ids = [idx for idx, _ in filtered]
-            needs_rebuild = full_rebuild or (set(current_ids) != set(needed_ids)) or (not current_ids and not needed_ids)
-
-            if needs_rebuild:
-                # full rebuild, clear and recreate
-
-                while self.beatmap_layout.count():
-                    child = self.beatmap_layout.takeAt(0)
-                    if child.widget():
-                        child.widget().deleteLater()
-
-                if not filtered:
-                    msg = "No beatmaps tracked yet.\n☻" if not self.beatmaps else "No beatmaps match the current filter."
-                    empty_label = QLabel(msg)
-                    empty_label.setStyleSheet(f"color: {COLOR_TEXT_DIM}; font-size: 13px;")
-                    empty_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-                    self.beatmap_layout.addWidget(empty_label)
-                else:
-                    for original_index, beatmap in filtered:
-                        card = BeatmapCard(beatmap, original_index, self)
-                        # clicked signal not connected: mousepressevent handles selection directly
-
-                        if original_index in self._selected_card_indices:
-                            card.set_selected(True)
-                        self.beatmap_layout.addWidget(card)
-
-                self.beatmap_layout.addStretch()
-            else:
-                # only reorder, detach all cards, reattach in new order
-
-                cards = {}
-                orphans = []
-                for i in range(self.beatmap_layout.count()):
-                    w = self.beatmap_layout.itemAt(i).widget()
-                    if isinstance(w, BeatmapCard):
-                        cards[w.index] = w
-                    elif w is not None:
-                        orphans.append(w)
-
-                # remove all items from layout
-
-                while self.beatmap_layout.count():
-                    self.beatmap_layout.takeAt(0)
-
-                # delete non card widgets (empty labels etc)
+            needed_ids = {idx for idx, _ in shown}
+            needs_rebuild = full_rebuild or self._current_card_ids != needed_ids or not needed_ids
+
+            # one layout and paint pass for the whole rebuild instead of one per card
+
+            with _batch_updates(self.beatmap_container, self._tracked_scroll.verticalScrollBar()):
+                if needs_rebuild:
+                    # full rebuild, clear the layout and hand the cards back to the pool
+
+                    while self.beatmap_layout.count():
+                        child = self.beatmap_layout.takeAt(0)
+                        widget = child.widget()
+                        if widget is not None and not isinstance(widget, BeatmapCard):
+                            widget.deleteLater()
+                    self._release_tracked_cards()
+                    self._current_card_ids = needed_ids
+
+                    if not filtered:
+                        msg = "No beatmaps tracked yet.\n☻" if not self.beatmaps else "No beatmaps match the current filter."
+                        empty_label = QLabel(msg)
+                        empty_label.setStyleSheet(f"color: {COLOR_TEXT_DIM}; font-size: 13px;")
+                        empty_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
+                        self.beatmap_layout.addWidget(empty_label)
+                    else:
+                        for original_index, beatmap in shown:
+                            # clicked signal not connected: mousepressevent handles selection directly
 
-                for w in orphans:
-                    w.deleteLater()
+                            card = self._take_tracked_card(beatmap, original_index)
+                            self.beatmap_layout.addWidget(card)
+                            card.show()
+                            self._tracked_cards.append(card)
 
-                if not filtered:
-                    msg = "No beatmaps match the current filter."
-                    empty_label = QLabel(msg)
-                    empty_label.setStyleSheet(f"color: {COLOR_TEXT_DIM}; font-size: 13px;")
-                    empty_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-                    self.beatmap_layout.addWidget(empty_label)
+                    self.beatmap_layout.addStretch()
                 else:
-                    for original_index, bm in filtered:
-                        if original_index in cards:
-                            card = cards[original_index]
+                    # same cards, only move the ones out of place. the layout holds just
+                    # the cards and the trailing stretch, _tracked_cards mirrors it
+
+                    cards = {c.index: c for c in self._tracked_cards}
+                    order = self._tracked_cards
+                    for i, (original_index, bm) in enumerate(shown):
+                        card = cards[original_index]
+                        if changed_indices is None or original_index in changed_indices:
                             card.refresh_data(bm)  # update status/data in place
 
-                            self.beatmap_layout.addWidget(card)
-
-                self.beatmap_layout.addStretch()
+                        if order[i] is not card:
+                            order.remove(card)
+                            order.insert(i, card)
+                            self.beatmap_layout.insertWidget(i, card)
 
         except Exception as e:
             try:
                 self.status_label.setText(f"List update error: {e}")
             except Exception:
                 pass
+
+    def _rebuild_tracked_later(self):
+        # beatmap list changes queue one full rebuild for the end of this event loop
+        # pass, so several changes in a row only lay the cards out once
+
+        if not self._tracked_rebuild_pending:
+            self._tracked_rebuild_pending = True
+            QTimer.singleShot(0, self._flush_tracked_rebuild)
+
+    def _flush_tracked_rebuild(self):
+        self._tracked_rebuild_pending = False
+        self.update_beatmap_list(full_rebuild=True)
+
+    def _tracked_on_scroll(self, value):
+        # build the next batch of cards once the list is scrolled within two viewports of the end
+
+        sb = self._tracked_scroll.verticalScrollBar()
+        if value < sb.maximum() - 2 * sb.pageStep():
+            return
+        start = self._tracked_realized
+        if start >= len(self._tracked_filtered):
+            return
+        self._tracked_realized += _TRACKED_CARD_BATCH
+        layout = self.beatmap_layout
+        with _batch_updates(self.beatmap_container):
+            for original_index, beatmap in self._tracked_filtered[start:self._tracked_realized]:
+                card = self._take_tracked_card(beatmap, original_index)
+                layout.insertWidget(layout.count() - 1, card)
+                card.show()
+                self._tracked_cards.append(card)
+                self._current_card_ids.add(original_index)
+
+    def _take_tracked_card(self, beatmap, index):
+        # a pooled card repointed at beatmap, or a new one when the pool is empty
+
+        if self._card_pool:
+            card = self._card_pool.pop()
+            card.refresh_data(beatmap, index)
+        else:
+            card = BeatmapCard(beatmap, index, self)
+        card.set_selected(index in self._selected_card_indices)
+        return card
+
+    def _release_tracked_cards(self):
+        # hide the built cards and keep up to _TRACKED_CARD_POOL_SIZE of them for reuse
+
+        pool = self._card_pool
+        for card in self._tracked_cards:
+            if len(pool) < _TRACKED_CARD_POOL_SIZE:
+                card.hide()
+                pool.append(card)
+            else:
+                card.deleteLater()
+        self._tracked_cards = []
+
     def select_beatmap(self, index):
         # show details for this beatmap without changing selection state
 
@@ -3950,13 +4396,9 @@ class MainWindow(QMainWindow):
     def _toggle_card_selection(self, index, shift=False, ctrl=False):
         # multi select toggle with shift/ctrl support. shows details for just clicked card
 
-        # build ordered list of visible card indices
+        # ordered indices of every card passing the filter, built or not yet
 
-        visible_indices = []
-        for i in range(self.beatmap_layout.count()):
-            w = self.beatmap_layout.itemAt(i).widget()
-            if isinstance(w, BeatmapCard):
-                visible_indices.append(w.index)
+        visible_indices = [i for i, _ in self._tracked_filtered]
 
         if shift and hasattr(self, '_last_clicked_index') and self._last_clicked_index is not None:
             # shift+click: select range between last clicked and current
@@ -3993,9 +4435,8 @@ class MainWindow(QMainWindow):
                 self._show_beatmap_details(index)
             self._last_clicked_index = index
 
-        for i in range(self.beatmap_layout.count()):
-            w = self.beatmap_layout.itemAt(i).widget()
-            if isinstance(w, BeatmapCard):
+        with _batch_updates(self.beatmap_container):
+            for w in self._tracked_cards:
                 w.set_selected(w.index in self._selected_card_indices)
 
         n = len(self._selected_card_indices)
@@ -4007,18 +4448,12 @@ class MainWindow(QMainWindow):
         if index is None or index >= len(self.beatmaps):
             return
         beatmap = self.beatmaps[index]
-        status_info = BEATMAP_STATUS.get(str(beatmap['status_id']), BEATMAP_STATUS['0'])
+        status_info = _STATUS_BY_ANY.get(beatmap['status_id'], BEATMAP_STATUS['0'])
 
         self.detail_title.setText(f"{beatmap['artist']} - {beatmap['title']}")
         self.detail_creator.setText(f"by {beatmap['creator']}")
         self.detail_status.setText(status_info['name'])
-        self.detail_status.setStyleSheet(f"""
-            color: {status_info['color']};
-            font-size: 48px;
-            font-weight: bold;
-            padding: 20px;
-            text-shadow: 0 0 20px {status_info['color']}80;
-        """)
+        _set_card_state(self.detail_status, status_info['name'])
         self.detail_id.setText(f"ID: {beatmap['id']}")
 
         if 'last_checked' in beatmap:
@@ -4029,30 +4464,29 @@ class MainWindow(QMainWindow):
         # handle beatmap monitoring toggle
 
         if index < len(self.beatmaps):
+            if self.beatmaps[index].get('monitored', False) != monitored:
+                self._monitored_count += 1 if monitored else -1
             self.beatmaps[index]['monitored'] = monitored
             self.config['beatmaps'] = self.beatmaps
-            save_config(self.config)
+            self._save_config_later()
             status_text = "enabled" if monitored else "disabled"
             self.status_label.setText(f"Monitoring {status_text} for: {self.beatmaps[index]['title']}")
-            monitored_count = sum(1 for b in self.beatmaps if b.get('monitored', False))
-            self.counter_label.setText(f"{monitored_count} / {len(self.beatmaps)} monitored")
+            self.counter_label.setText(f"{self._monitored_count} / {len(self.beatmaps)} monitored")
             # refresh badge on card
 
-            for i in range(self.beatmap_layout.count()):
-                w = self.beatmap_layout.itemAt(i).widget()
-                if isinstance(w, BeatmapCard) and w.index == index:
+            for w in self._tracked_cards:
+                if w.index == index:
                     w.refresh_monitoring_state()
                     break
 
     # bulk actions
 
     def bulk_select_all(self):
-        # select all visible cards
+        # select all cards passing the filter, including ones not built yet
 
-        for i in range(self.beatmap_layout.count()):
-            w = self.beatmap_layout.itemAt(i).widget()
-            if isinstance(w, BeatmapCard):
-                self._selected_card_indices.add(w.index)
+        self._selected_card_indices.update(i for i, _ in self._tracked_filtered)
+        with _batch_updates(self.beatmap_container):
+            for w in self._tracked_cards:
                 w.set_selected(True)
         n = len(self._selected_card_indices)
         if n:
@@ -4062,9 +4496,8 @@ class MainWindow(QMainWindow):
         # deselect all cards
 
         self._selected_card_indices.clear()
-        for i in range(self.beatmap_layout.count()):
-            w = self.beatmap_layout.itemAt(i).widget()
-            if isinstance(w, BeatmapCard):
+        with _batch_updates(self.beatmap_container):
+            for w in self._tracked_cards:
                 w.set_selected(False)
         self.status_label.setText("Selection cleared")
 
@@ -4076,14 +4509,26 @@ class MainWindow(QMainWindow):
         if not to_remove:
             self.status_label.setText("Select cards first (click to select), then delete")
             return
-        for idx in sorted(set(to_remove), reverse=True):
-            self.beatmaps.pop(idx)
+        # one pass over the list instead of a pop (and shift) per removed index. the
+        # list is rebuilt in place so self.config['beatmaps'] keeps pointing at it
+
+        kill = self._selected_card_indices
+        kept = []
+        for i, bm in enumerate(self.beatmaps):
+            if i in kill:
+                self._tracked_ids.discard(bm['id'])
+                self._haystacks.pop(bm['id'], None)
+                if bm.get('monitored', False):
+                    self._monitored_count -= 1
+            else:
+                kept.append(bm)
+        self.beatmaps[:] = kept
         if self.selected_index is not None and self.selected_index in to_remove:
             self._clear_detail_panel()
         self._selected_card_indices.clear()
         self.config['beatmaps'] = self.beatmaps
-        save_config(self.config)
-        self.update_beatmap_list(full_rebuild=True)
+        self._save_config_later()
+        self._rebuild_tracked_later()
         self.status_label.setText(f"Deleted {len(to_remove)} beatmap(s)")
 
     def delete_all_beatmaps(self):
@@ -4094,10 +4539,13 @@ class MainWindow(QMainWindow):
             return
         count = len(self.beatmaps)
         self.beatmaps.clear()
+        self._tracked_ids.clear()
+        self._haystacks.clear()
+        self._monitored_count = 0
         self._clear_detail_panel()
         self.config['beatmaps'] = self.beatmaps
-        save_config(self.config)
-        self.update_beatmap_list(full_rebuild=True)
+        self._save_config_later()
+        self._rebuild_tracked_later()
         self.status_label.setText(f"Deleted all {count} beatmap(s)")
 
 
@@ -4105,9 +4553,10 @@ class MainWindow(QMainWindow):
         # add beatmaps received from browsequalifieddialog
 
         added = 0
+        now = time.time()
         for bm in beatmap_list:
             bid = bm['id']
-            if any(b['id'] == bid for b in self.beatmaps):
+            if bid in self._tracked_ids:
                 continue
             self.beatmaps.append({
                 'id': bid,
@@ -4115,27 +4564,33 @@ class MainWindow(QMainWindow):
                 'title': bm['title'],
                 'creator': bm['creator'],
                 'status_id': bm['status_id'],
+                'diff_id': bm.get('diff_id'),  # any one difficulty, for batched status checks
                 'mode': bm.get('mode', '0'),
                 'modes': bm.get('modes', ['0']),
                 'diffs': bm.get('diffs', []),
                 'diff_count': bm.get('diff_count', 0),
                 'added_at': time.time(),
                 'monitored': False,
-                'last_checked': time.time(),
+                'last_checked': now,
             })
+            self._tracked_ids.add(bid)
             added += 1
         if added:
             self.config['beatmaps'] = self.beatmaps
-            save_config(self.config)
-            self.update_beatmap_list(full_rebuild=True)
+            self._save_config_later()
+            self._rebuild_tracked_later()
             self.status_label.setText(f"Added {added} beatmap(s) from Browse Qualified.")
 
 
     def remove_beatmap(self, index):
-        self.beatmaps.pop(index)
+        removed = self.beatmaps.pop(index)
+        self._tracked_ids.discard(removed['id'])
+        self._haystacks.pop(removed['id'], None)
+        if removed.get('monitored', False):
+            self._monitored_count -= 1
         self.config['beatmaps'] = self.beatmaps
-        save_config(self.config)
-        self.update_beatmap_list(full_rebuild=True)
+        self._save_config_later()
+        self._rebuild_tracked_later()
 
         if self.selected_index == index:
             self._clear_detail_panel()
@@ -4146,8 +4601,7 @@ class MainWindow(QMainWindow):
                 self.status_label.setText("Add at least one beatmap first")
                 return
 
-            monitored_count = sum(1 for b in self.beatmaps if b.get('monitored', False))
-            if monitored_count == 0:
+            if self._monitored_count == 0:
                 self.status_label.setText("Enable tracking for at least one beatmap (right click a card)")
                 return
 
@@ -4161,6 +4615,8 @@ class MainWindow(QMainWindow):
             self.monitor_btn.danger = True
             self.monitor_btn.update_style()
             self.status_label.setText("Tracking active...")
+            self._quiet_ticks = 0
+            self.timer.setInterval(self.config.get('check_interval', DEFAULT_CHECK_INTERVAL))
             self.timer.start()
             self.check_beatmaps()  # initial check
 
@@ -4168,11 +4624,11 @@ class MainWindow(QMainWindow):
             self.is_monitoring = False
             self.timer.stop()
 
-            # stop all sounds
+            # stop all sounds, and write out whatever the last checks changed
 
-            pygame.mixer.stop()
-            if self.sound_effect:
-                self.sound_effect.stop()
+            self._stop_notification_sound()
+            if self._save_timer.isActive():
+                self._flush_config()
 
             self.monitor_btn.setText("START TRACKING")
             self.monitor_btn.primary = True
@@ -4186,116 +4642,145 @@ class MainWindow(QMainWindow):
         pygame.mixer.stop()
         if self.sound_effect:
             self.sound_effect.stop()
+        self._sound_end_timer.stop()
         self.stop_sound_btn.setVisible(False)
 
+    def _play_notification_sound(self):
+        # play the notification and show the stop button until the sound should be over
+
+        self._notify_channel.play(self.sound_effect)
+        self.stop_sound_btn.setVisible(True)
+        self._sound_end_timer.start(int(self.sound_effect.get_length() * 1000) + 100)
+
     def _check_sound_playing(self):
-        # called by timer — show/hide stop button based on sound state
+        # called once the sound should have ended, hide the stop button or look again shortly
 
-        playing = pygame.mixer.get_busy()
-        if hasattr(self, "stop_sound_btn"):
-            self.stop_sound_btn.setVisible(bool(playing))
+        if self._notify_channel.get_busy():
+            self._sound_end_timer.start(200)
+        else:
+            self.stop_sound_btn.setVisible(False)
 
     def setup_timer(self):
+        # none of these timers need better than coarse (~5%) accuracy, which also keeps
+        # qt from asking windows for a finer system timer resolution
+
         self.timer = QTimer()
+        self.timer.setTimerType(Qt.TimerType.CoarseTimer)
         self.timer.timeout.connect(self.check_beatmaps)
         self.timer.setInterval(self.config.get('check_interval', DEFAULT_CHECK_INTERVAL))
-        self._monitor_worker = None  # active worker thread
+        self._monitor_worker = None  # long lived MonitorWorkerThread, started on the first check
 
-        # sound state poller, runs always, lightweight
+        self._monitor_pending = False  # a submitted check has not reported back yet
 
-        self._sound_check_timer = QTimer()
-        self._sound_check_timer.timeout.connect(self._check_sound_playing)
-        self._sound_check_timer.setInterval(200)
-        self._sound_check_timer.start()
+        self._quiet_ticks = 0  # checks in a row without a status change, for adaptive_interval
+
+        # armed by _play_notification_sound for the length of the sound, idle otherwise
+
+        self._sound_end_timer = QTimer()
+        self._sound_end_timer.setTimerType(Qt.TimerType.CoarseTimer)
+        self._sound_end_timer.setSingleShot(True)
+        self._sound_end_timer.timeout.connect(self._check_sound_playing)
 
     def check_beatmaps(self):
         if not self.is_monitoring:
             return
         # don't start a new check if previous one is still running
 
-        if self._monitor_worker and self._monitor_worker.isRunning():
+        if self._monitor_pending:
             return
-        self._monitor_worker = MonitorWorkerThread(
-            [dict(b) for b in self.beatmaps],  # snapshot copy
+        # every card's tracking is off, no worker or request needed this tick
 
+        if self._monitored_count == 0:
+            self.status_label.setText("Nothing to track")
+            return
+        if self._monitor_worker is None:
+            self._monitor_worker = MonitorWorkerThread()
+            self._monitor_worker.result_ready.connect(self._on_monitor_results)
+            self._monitor_worker.start()
+        self._monitor_pending = self._monitor_worker.submit(
+            [(i, b['id'], b['status_id'], b.get('last_checked', 0), b.get('diff_id'))
+             for i, b in enumerate(self.beatmaps) if b.get('monitored', False)],
             self.config['client_id'],
-            self.config['client_secret']
+            self.config['client_secret'],
+            cache_ttl=self.config.get('api_cache_ttl', 0)
         )
-        self._monitor_worker.result_ready.connect(self._on_monitor_results)
-        self._monitor_worker.start()
 
     def _on_monitor_results(self, results):
-        # called in main thread after monitor worker finishes
+        # called in main thread after monitor worker finishes a check
 
+        self._monitor_pending = False
         try:
             if not self.is_monitoring:
                 return
 
             beatmaps_to_remove = []
             has_changes = False
+            learned_diff_id = False  # a quiet check filled in a diff_id, worth persisting
+            changed = set()  # indices whose status changed, refreshed in place below
             checked_selected = False
+            now = time.time()
+            beatmaps = self.beatmaps
+            selected = self.selected_index
+            auto_stop = self.config.get('auto_stop_monitoring', False)
+            # one status line for the whole batch, the last change wins
+
+            last_msg = None
 
             for r in results:
                 try:
-                    if r.get('skipped'):
-                        continue
                     i = r['index']
                     info = r['info']
+                    # skip rows that were deleted or moved while the check ran
+
+                    if i >= len(beatmaps) or beatmaps[i]['id'] != r['id']:
+                        continue
                     if not info['ok']:
                         continue
 
-                    old_status = r['old_status']
-                    new_status = info['status_id']
-
-                    self.beatmaps[i]['status_id'] = new_status
-                    self.beatmaps[i]['last_checked'] = time.time()
+                    bm = beatmaps[i]
+                    bm['status_id'] = info['status_id']
+                    bm['last_checked'] = now
+                    diff_id = info.get('diff_id')
+                    if diff_id and bm.get('diff_id') != diff_id:
+                        bm['diff_id'] = diff_id
+                        learned_diff_id = True
                     if info.get('diffs'):
-                        self.beatmaps[i]['diffs'] = info['diffs']
-                        self.beatmaps[i]['diff_count'] = info.get('diff_count', len(info['diffs']))
+                        bm['diffs'] = info['diffs']
+                        bm['diff_count'] = info.get('diff_count', len(info['diffs']))
 
-                    if self.selected_index is not None and i == self.selected_index:
+                    if i == selected:
                         checked_selected = True
 
-                    if old_status != new_status:
-                        has_changes = True
-                        old_info = BEATMAP_STATUS.get(str(old_status), BEATMAP_STATUS['0'])
-                        new_info = BEATMAP_STATUS.get(str(new_status), BEATMAP_STATUS['0'])
-
-                        history_entry = {
-                            'timestamp': time.time(),
-                            'beatmap_id': r['beatmap']['id'],
-                            'title': f"{info['artist']} - {info['title']}",
-                            'creator': info['creator'],
-                            'old_status': old_info['name'],
-                            'new_status': new_info['name'],
-                            'approved_date': info.get('approved_date', None),
-                            'mode': info.get('mode', '0')
-                        }
-                        self.history.insert(0, history_entry)
-                        self.history = self.history[:100]
-                        self.config['history'] = self.history
-
-                        if old_status != new_status:
-                            if self.sound_effect and self.config.get('sound_enabled', True):
-                                try:
-                                    self.sound_effect.play()
-                                except Exception:
-                                    pass
-                            if self.config.get('auto_stop_monitoring', False):
-                                self.beatmaps[i]['monitored'] = False
-                                self.status_label.setText(
-                                    f"{info['artist']} - {info['title']} is now {new_info['name']}! Tracking disabled."
-                                )
-                            else:
-                                self.status_label.setText(
-                                    f"{info['artist']} - {info['title']} is now {new_info['name']}!"
-                                )
+                    # the worker attaches a history entry only when the status changed
+
+                    history_entry = r.get('history')
+                    if history_entry is None:
+                        continue
+
+                    has_changes = True
+                    changed.add(i)
+                    self.history.appendleft(history_entry)
+
+                    if self.sound_effect and self.config.get('sound_enabled', True):
+                        try:
+                            self._play_notification_sound()
+                        except Exception:
+                            pass
+                    if auto_stop:
+                        if bm.get('monitored', False):
+                            self._monitored_count -= 1
+                        bm['monitored'] = False
+                        last_msg = f"{history_entry['title']} is now {history_entry['new_status']}! Tracking disabled."
+                    else:
+                        last_msg = f"{history_entry['title']} is now {history_entry['new_status']}!"
                 except Exception:
                     pass
 
-            if self.config.get('auto_stop_monitoring', False):
-                all_done = all(not b.get('monitored', False) for b in self.beatmaps)
-                if all_done and has_changes:
+            if last_msg:
+                self.status_label.setText(last_msg)
+
+            if auto_stop:
+                if self._monitored_count == 0 and has_changes:
                     self.is_monitoring = False
                     self.timer.stop()
                     self.monitor_btn.setText("START TRACKING")
@@ -4304,17 +4789,32 @@ class MainWindow(QMainWindow):
                     self.monitor_btn.update_style()
                     self.status_label.setText("All monitored beatmaps reached final status. Tracking stopped.")
 
-            if has_changes or beatmaps_to_remove:
+            # diff_id lets the next session batch this set instead of a lookup per set
+
+            if has_changes or beatmaps_to_remove or learned_diff_id:
                 self.config['beatmaps'] = self.beatmaps
-                save_config(self.config)
+                self._save_config_later()
 
             if has_changes:
-                self.update_beatmap_list(full_rebuild=True)
+                # same cards: only the changed ones are refilled. a filter or sort that
+                # now shows different cards rebuilds from the card pool
+
+                self.update_beatmap_list(changed_indices=changed)
                 if self.selected_index is not None and self.selected_index < len(self.beatmaps):
                     self.select_beatmap(self.selected_index)
             elif checked_selected and self.selected_index is not None and self.selected_index < len(self.beatmaps):
                 self.select_beatmap(self.selected_index)
 
+            # opt-in backoff: every 4 quiet checks add one base interval, up to 5x.
+            # setInterval restarts a running timer, so only touch it when the step changes
+
+            if self.config.get('adaptive_interval', False) and self.is_monitoring:
+                base = self.config.get('check_interval', DEFAULT_CHECK_INTERVAL)
+                self._quiet_ticks = 0 if has_changes else self._quiet_ticks + 1
+                interval = min(base * (1 + self._quiet_ticks // 4), base * 5)
+                if interval != self.timer.interval():
+                    self.timer.setInterval(interval)
+
             check_time = time.strftime('%H:%M:%S')
             if self.is_monitoring and not has_changes:
                 self.status_label.setText(f"Checked at {check_time}")
@@ -4324,10 +4824,37 @@ class MainWindow(QMainWindow):
             except Exception:
                 pass
 
+    def _save_config_later(self):
+        # writes within the next 500 ms are folded into this one
+
+        if not self._save_timer.isActive():
+            self._save_timer.start()
+
+    def _flush_config(self):
+        # serialise here so the writer never sees the config mid change
+
+        self._save_timer.stop()
+        snapshot = dump_config(self.config)
+        self._save_pool.start(lambda: write_config(*snapshot))
+
+    def closeEvent(self, event):
+        if self._monitor_worker is not None:
+            self._monitor_worker.stop()
+            self._monitor_worker.wait(6000)  # at most one request timeout
+        if self._save_timer.isActive():
+            self._flush_config()
+        self._save_pool.waitForDone()
+        super().closeEvent(event)
+
     def show_settings(self):
         dialog = SettingsDialog(self.config, self)
         if dialog.exec():
+            # the reloaded config gets the live beatmap list and history back, later
+            # throttled saves write them through self.config
+
             self.config = load_config()
+            self.config['beatmaps'] = self.beatmaps
+            self.config['history'] = self.history
             self.load_sound()
             # update timer interval if monitoring is active
             new_interval = self.config.get('check_interval', DEFAULT_CHECK_INTERVAL)
@@ -4341,14 +4868,64 @@ class MainWindow(QMainWindow):
             client_id=self.config.get('client_id', ''),
             client_secret=self.config.get('client_secret', ''),
             utc_offset=self.config.get('utc_offset', 0),
-            on_history_changed=lambda: save_config(self.config),
+            on_history_changed=self._save_config_later,
             parent=self
         )
         dialog.exec()
 
     def show_info(self):
-        dlg = InfoDialog(self)
-        dlg.exec()
+        if self._info_dialog is None:
+            self._info_dialog = InfoDialog(self)
+        self._info_dialog.exec()
+
+
+# info dialog content never changes, build the shortcut table and text styles once
+
+_INFO_SHORTCUTS = (
+    ("Ctrl+A",       "Select all cards / rows in the active tab"),
+    ("Ctrl+Z",       "Deselect all"),
+    ("Delete",       "Delete selected tracked beatmaps"),
+    ("Enter",        "Tracked: toggle tracking for selected  |  Browse: add selected"),
+    ("Doubleclick", "Tracked: toggle tracking for that card  |  Browse: add that card"),
+    ("Ctrl+Enter",   "Browse: add ALL currently selected cards to tracking"),
+    ("Ctrl+R",       "Refresh all beatmaps  |  History: fetch missing rank dates"),
+    ("Esc",          "Close dialogs"),
+)
+_INFO_DIALOG_QSS = f"QDialog {{ background-color: {COLOR_BG}; }}"
+_INFO_BODY_QSS = f"background: {COLOR_BG};"
+_INFO_H_QSS = f"color: {COLOR_ACCENT}; font-size: 15px; font-weight: bold;"
+_INFO_H_BIG_QSS = f"color: {COLOR_ACCENT}; font-size: 22px; font-weight: bold;"
+_INFO_P_QSS = f"color: {COLOR_TEXT}; font-size: 13px;"
+_INFO_DIM_QSS = f"color: {COLOR_TEXT_DIM}; font-size: 12px;"
+_INFO_SEP_QSS = f"background: {COLOR_ACCENT}30; border: none;"
+_INFO_KEY_QSS = (
+    f"color: {COLOR_ACCENT}; font-family: Consolas; font-size: 12px; "
+    f"font-weight: bold; background: transparent;")
+_INFO_DESC_QSS = f"color: {COLOR_TEXT}; font-size: 12px; background: transparent;"
+_INFO_GRID_QSS = f"background: {COLOR_CARD}; border-radius: 8px;"
+_INFO_SCROLL_QSS = (
+    f"QScrollArea {{ border: none; background: {COLOR_BG}; }}"
+    f"QScrollArea > QWidget > QWidget {{ background: {COLOR_BG}; }}"
+    + _scrollbar_style()
+)
+
+# github / osu! link buttons share one style
+
+_LINK_BTN_QSS = f"""
+    QPushButton {{
+        background-color: {COLOR_CARD};
+        color: {COLOR_TEXT};
+        border: 2px solid {COLOR_ACCENT}40;
+        border-radius: 8px;
+        padding: 8px 16px;
+        font-size: 13px;
+        font-weight: bold;
+    }}
+    QPushButton:hover {{
+        border: 2px solid {COLOR_ACCENT};
+        background-color: {COLOR_BG_LIGHT};
+    }}
+"""
 
 
 class InfoDialog(QDialog):
@@ -4363,7 +4940,7 @@ class InfoDialog(QDialog):
             Qt.WindowType.Dialog | Qt.WindowType.CustomizeWindowHint |
             Qt.WindowType.WindowTitleHint | Qt.WindowType.WindowCloseButtonHint
         )
-        self.setStyleSheet(f"QDialog {{ background-color: {COLOR_BG}; }}")
+        self.setStyleSheet(_INFO_DIALOG_QSS)
         self._setup_ui()
 
     def _setup_ui(self):
@@ -4373,40 +4950,35 @@ class InfoDialog(QDialog):
 
         scroll = QScrollArea()
         scroll.setWidgetResizable(True)
-        scroll.setStyleSheet(
-            f"QScrollArea {{ border: none; background: {COLOR_BG}; }}"
-            f"QScrollArea > QWidget > QWidget {{ background: {COLOR_BG}; }}"
-            + _scrollbar_style()
-        )
+        scroll.setStyleSheet(_INFO_SCROLL_QSS)
 
         body = QWidget()
-        body.setStyleSheet(f"background: {COLOR_BG};")
+        body.setStyleSheet(_INFO_BODY_QSS)
         layout = QVBoxLayout(body)
         layout.setContentsMargins(28, 24, 28, 24)
         layout.setSpacing(14)
 
         def _h(text, big=False):
             label = QLabel(text)
-            sz = "22" if big else "15"
-            label.setStyleSheet(f"color: {COLOR_ACCENT}; font-size: {sz}px; font-weight: bold;")
+            label.setStyleSheet(_INFO_H_BIG_QSS if big else _INFO_H_QSS)
             return label
 
         def _p(text):
             label = QLabel(text)
-            label.setStyleSheet(f"color: {COLOR_TEXT}; font-size: 13px;")
+            label.setStyleSheet(_INFO_P_QSS)
             label.setWordWrap(True)
             return label
 
         def _dim(text):
             label = QLabel(text)
-            label.setStyleSheet(f"color: {COLOR_TEXT_DIM}; font-size: 12px;")
+            label.setStyleSheet(_INFO_DIM_QSS)
             label.setWordWrap(True)
             return label
 
         def _sep():
             separator = QFrame()
             separator.setFrameShape(QFrame.Shape.HLine)
-            separator.setStyleSheet(f"background: {COLOR_ACCENT}30; border: none;")
+            separator.setStyleSheet(_INFO_SEP_QSS)
             separator.setFixedHeight(1)
             return separator
 
@@ -4437,31 +5009,18 @@ class InfoDialog(QDialog):
         layout.addWidget(_sep())
         layout.addWidget(_h("Keyboard Shortcuts"))
 
-        shortcuts = [
-            ("Ctrl+A",       "Select all cards / rows in the active tab"),
-            ("Ctrl+Z",       "Deselect all"),
-            ("Delete",       "Delete selected tracked beatmaps"),
-            ("Enter",        "Tracked: toggle tracking for selected  |  Browse: add selected"),
-            ("Doubleclick", "Tracked: toggle tracking for that card  |  Browse: add that card"),
-            ("Ctrl+Enter",   "Browse: add ALL currently selected cards to tracking"),
-            ("Ctrl+R",       "Refresh all beatmaps  |  History: fetch missing rank dates"),
-            ("Esc",          "Close dialogs"),
-        ]
-
         grid_w = QWidget()
-        grid_w.setStyleSheet(f"background: {COLOR_CARD}; border-radius: 8px;")
+        grid_w.setStyleSheet(_INFO_GRID_QSS)
         grid = QGridLayout(grid_w)
         grid.setContentsMargins(14, 10, 14, 10)
         grid.setSpacing(6)
         grid.setColumnMinimumWidth(0, 140)
 
-        for row_i, (key, desc) in enumerate(shortcuts):
+        for row_i, (key, desc) in enumerate(_INFO_SHORTCUTS):
             key_lbl = QLabel(key)
-            key_lbl.setStyleSheet(
-                f"color: {COLOR_ACCENT}; font-family: Consolas; font-size: 12px; "
-                f"font-weight: bold; background: transparent;")
+            key_lbl.setStyleSheet(_INFO_KEY_QSS)
             desc_lbl = QLabel(desc)
-            desc_lbl.setStyleSheet(f"color: {COLOR_TEXT}; font-size: 12px; background: transparent;")
+            desc_lbl.setStyleSheet(_INFO_DESC_QSS)
             grid.addWidget(key_lbl, row_i, 0)
             grid.addWidget(desc_lbl, row_i, 1)
 
@@ -4479,21 +5038,7 @@ class InfoDialog(QDialog):
 
         github_btn = QPushButton("GitHub")
         github_btn.setCursor(Qt.CursorShape.PointingHandCursor)
-        github_btn.setStyleSheet(f"""
-            QPushButton {{
-                background-color: {COLOR_CARD};
-                color: {COLOR_TEXT};
-                border: 2px solid {COLOR_ACCENT}40;
-                border-radius: 8px;
-                padding: 8px 16px;
-                font-size: 13px;
-                font-weight: bold;
-            }}
-            QPushButton:hover {{
-                border: 2px solid {COLOR_ACCENT};
-                background-color: {COLOR_BG_LIGHT};
-            }}
-        """)
+        github_btn.setStyleSheet(_LINK_BTN_QSS)
         github_btn.clicked.connect(lambda: webbrowser.open("https://github.com/creicer/osu-beatmap-tracker-MikuEye"))  # todo: replace link
 
 
@@ -4501,21 +5046,7 @@ class InfoDialog(QDialog):
 
         osu_btn = QPushButton("osu!")
         osu_btn.setCursor(Qt.CursorShape.PointingHandCursor)
-        osu_btn.setStyleSheet(f"""
-            QPushButton {{
-                background-color: {COLOR_CARD};
-                color: {COLOR_TEXT};
-                border: 2px solid {COLOR_ACCENT}40;
-                border-radius: 8px;
-                padding: 8px 16px;
-                font-size: 13px;
-                font-weight: bold;
-            }}
-            QPushButton:hover {{
-                border: 2px solid {COLOR_ACCENT};
-                background-color: {COLOR_BG_LIGHT};
-            }}
-        """)
+        osu_btn.setStyleSheet(_LINK_BTN_QSS)
         osu_btn.clicked.connect(lambda: webbrowser.open("https://osu.ppy.sh/users/12100958"))  # todo: replace link
 
 